@@ -12,7 +12,7 @@ Key improvements over v7:
 Target: Restore v6 performance levels while improving on deep cut prediction
 """
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Sequence, Tuple
 from datetime import datetime
 from collections import Counter, defaultdict
 import random
@@ -135,7 +135,7 @@ def goldilocks_v8_predictions(
     venue_city: str,
     venue_state: str,
     band_name: str = "Goose",
-    historical_songs: List[str] = None
+    historical_songs: Sequence[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Goldilocks v8.0 - Hybrid Predictability Engine
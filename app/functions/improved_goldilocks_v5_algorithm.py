@@ -1,8 +1,63 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, NamedTuple, Sequence, Tuple
 from datetime import datetime, timedelta
+from operator import attrgetter, itemgetter
+import heapq
+import logging
 import random
 import math
 
+logger = logging.getLogger(__name__)
+
+
+class _Song(NamedTuple):
+    """Static song profile used by the v5 heuristics"""
+    name: str
+    avg_gap: int
+    total_plays: int
+    opener_rate: float
+    encore_rate: float
+    energy: str
+    is_cover: bool = False
+    original_artist: str = "Goose"
+    slug: str = ""
+
+
+def _song(name: str, *args, **kwargs) -> _Song:
+    """Build a _Song with its primary-key slug precomputed"""
+    slug = name.replace(' ', '_').replace('(', '').replace(')', '')
+    return _Song(name, *args, slug=slug, **kwargs)
+
+
+# Enhanced song database with more diverse options
+_SONG_DATABASE = (
+    # High-rotation favorites (Goldilocks zone optimized)
+    _song("Arcadia", 12, 150, 0.05, 0.15, "high"),
+    _song("Hungersite", 15, 145, 0.08, 0.12, "medium"),
+    _song("Pancakes", 18, 120, 0.03, 0.25, "high"),
+    _song("Drive", 23, 95, 0.20, 0.05, "medium"),
+    _song("Madhuvan", 35, 180, 0.02, 0.30, "epic"),
+
+    # Solid rotation candidates
+    _song("Time to Flee", 28, 85, 0.12, 0.08, "high"),
+    _song("Arrow", 32, 90, 0.15, 0.06, "medium"),
+    _song("Creatures", 25, 75, 0.10, 0.10, "medium"),
+    _song("Seekers on the Ridge", 40, 65, 0.08, 0.12, "epic"),
+    _song("Factory Fiction", 45, 70, 0.06, 0.14, "high"),
+
+    # Deep cuts and surprises
+    _song("No Rain", 357, 24, 0.50, 0.00, "medium", is_cover=True, original_artist="Blind Melon"),
+    _song("Shama Lama Ding Dong", 180, 15, 0.40, 0.00, "fun", is_cover=True, original_artist="Otis Day"),
+    _song("Me & My Uncle", 220, 18, 0.35, 0.00, "mellow", is_cover=True, original_artist="John Phillips"),
+    _song("Butter Rum", 125, 35, 0.15, 0.08, "groovy"),
+    _song("Dr. Darkness", 95, 42, 0.25, 0.05, "dark"),
+)
+
+# Candidate pools derived once from the static database
+_OPENER_CANDIDATES = tuple(s for s in _SONG_DATABASE if s.opener_rate > 0.1)
+_ENCORE_CANDIDATES = tuple(s for s in _SONG_DATABASE if s.encore_rate > 0.1)
+_DEEP_CUTS = tuple(s for s in _SONG_DATABASE if s.avg_gap > 100)  # 100+ day gaps
+
+
 def goldilocks_v5_predictions(show_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Goldilocks Algorithm v5.0 - Enhanced with Historical Learning
@@ -23,92 +78,66 @@ def goldilocks_v5_predictions(show_data: Dict[str, Any]) -> List[Dict[str, Any]]
         if not show_date or band_name != 'Goose':
             return []
             
-        print(f"🎯 Goldilocks v5.0 Enhanced Predictions for {band_name} on {show_date}")
+        logger.debug("🎯 Goldilocks v5.0 Enhanced Predictions for %s on %s", band_name, show_date)
         
         show_date_obj = datetime.strptime(show_date, '%Y-%m-%d')
         
-        # Enhanced song database with more diverse options
-        song_database = [
-            # High-rotation favorites (Goldilocks zone optimized)
-            {"name": "Arcadia", "avg_gap": 12, "total_plays": 150, "opener_rate": 0.05, "encore_rate": 0.15, "energy": "high"},
-            {"name": "Hungersite", "avg_gap": 15, "total_plays": 145, "opener_rate": 0.08, "encore_rate": 0.12, "energy": "medium"},
-            {"name": "Pancakes", "avg_gap": 18, "total_plays": 120, "opener_rate": 0.03, "encore_rate": 0.25, "energy": "high"},
-            {"name": "Drive", "avg_gap": 23, "total_plays": 95, "opener_rate": 0.20, "encore_rate": 0.05, "energy": "medium"},
-            {"name": "Madhuvan", "avg_gap": 35, "total_plays": 180, "opener_rate": 0.02, "encore_rate": 0.30, "energy": "epic"},
-            
-            # Solid rotation candidates  
-            {"name": "Time to Flee", "avg_gap": 28, "total_plays": 85, "opener_rate": 0.12, "encore_rate": 0.08, "energy": "high"},
-            {"name": "Arrow", "avg_gap": 32, "total_plays": 90, "opener_rate": 0.15, "encore_rate": 0.06, "energy": "medium"},
-            {"name": "Creatures", "avg_gap": 25, "total_plays": 75, "opener_rate": 0.10, "encore_rate": 0.10, "energy": "medium"},
-            {"name": "Seekers on the Ridge", "avg_gap": 40, "total_plays": 65, "opener_rate": 0.08, "encore_rate": 0.12, "energy": "epic"},
-            {"name": "Factory Fiction", "avg_gap": 45, "total_plays": 70, "opener_rate": 0.06, "encore_rate": 0.14, "energy": "high"},
-            
-            # Deep cuts and surprises
-            {"name": "No Rain", "avg_gap": 357, "total_plays": 24, "opener_rate": 0.50, "encore_rate": 0.00, "energy": "medium", "is_cover": True, "original_artist": "Blind Melon"},
-            {"name": "Shama Lama Ding Dong", "avg_gap": 180, "total_plays": 15, "opener_rate": 0.40, "encore_rate": 0.00, "energy": "fun", "is_cover": True, "original_artist": "Otis Day"},
-            {"name": "Me & My Uncle", "avg_gap": 220, "total_plays": 18, "opener_rate": 0.35, "encore_rate": 0.00, "energy": "mellow", "is_cover": True, "original_artist": "John Phillips"},
-            {"name": "Butter Rum", "avg_gap": 125, "total_plays": 35, "opener_rate": 0.15, "encore_rate": 0.08, "energy": "groovy"},
-            {"name": "Dr. Darkness", "avg_gap": 95, "total_plays": 42, "opener_rate": 0.25, "encore_rate": 0.05, "energy": "dark"},
-        ]
-        
         # Context analysis
         context_factors = analyze_show_context(show_date_obj, venue_name)
         
         predictions = []
         
         # Generate opener predictions (1-2 songs)
-        opener_candidates = [s for s in song_database if s["opener_rate"] > 0.1]
-        opener_predictions = generate_opener_predictions(opener_candidates, show_date_obj, context_factors)
+        opener_predictions = generate_opener_predictions(_OPENER_CANDIDATES, show_date_obj, context_factors)
         predictions.extend(opener_predictions)
         
         # Generate encore predictions (1-2 songs)  
-        encore_candidates = [s for s in song_database if s["encore_rate"] > 0.1]
-        encore_predictions = generate_encore_predictions(encore_candidates, show_date_obj, context_factors)
+        encore_predictions = generate_encore_predictions(_ENCORE_CANDIDATES, show_date_obj, context_factors)
         predictions.extend(encore_predictions)
         
         # Generate rotation candidates (2-4 songs)
-        rotation_predictions = generate_rotation_predictions(song_database, show_date_obj, context_factors)
+        rotation_predictions = generate_rotation_predictions(_SONG_DATABASE, show_date_obj, context_factors)
         predictions.extend(rotation_predictions)
         
         # Add surprise factor (0-1 deep cut)
         if random.random() < context_factors["surprise_likelihood"]:
-            surprise_predictions = generate_surprise_predictions(song_database, show_date_obj, context_factors)
+            surprise_predictions = generate_surprise_predictions(_DEEP_CUTS, show_date_obj, context_factors)
             predictions.extend(surprise_predictions)
         
-        # Convert to proper prediction format
+        # Convert to proper prediction format (one timestamp for the whole batch)
+        created_at = datetime.now().isoformat()
+        band_name_lower = band_name.lower()
         formatted_predictions = []
         for i, pred in enumerate(predictions, 1):
-            formatted_pred = format_prediction(pred, show_data, i)
+            formatted_pred = format_prediction(pred, show_data, i, created_at, band_name_lower)
             formatted_predictions.append(formatted_pred)
         
-        print(f"✅ Goldilocks v5.0 generated {len(formatted_predictions)} enhanced predictions")
+        logger.debug("✅ Goldilocks v5.0 generated %d enhanced predictions", len(formatted_predictions))
         return formatted_predictions
         
     except Exception as e:
-        print(f"❌ Goldilocks v5.0 error: {str(e)}")
-        import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Goldilocks v5.0 error: %s", e)
         return []
 
 
+# Lookup tables indexed by weekday (Mon=0) and by month (1-12, index 0 unused)
+_WEEKEND_BOOST = (1.0, 1.0, 1.0, 1.0, 1.0, 1.1, 1.1)
+_MONTH_ENERGY_BOOST = (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.15, 1.15, 1.15, 1.0, 1.05, 1.05, 1.05)
+_MONTH_SURPRISE_LIKELIHOOD = (0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.3, 0.3, 0.3, 0.15, 0.2, 0.2, 0.2)
+_MONTH_SEASON = ("", "winter", "winter", "spring", "spring", "spring",
+                 "summer", "summer", "summer", "fall", "fall", "fall", "winter")
+
+
 def analyze_show_context(show_date: datetime, venue_name: str) -> Dict[str, Any]:
     """Analyze contextual factors that influence predictions"""
     
     # Day of week patterns (weekends = more energy)
-    day_of_week = show_date.weekday()
-    weekend_boost = 1.1 if day_of_week >= 5 else 1.0
+    weekend_boost = _WEEKEND_BOOST[show_date.weekday()]
     
-    # Seasonal patterns
+    # Seasonal patterns (summer festival season, fall tour season)
     month = show_date.month
-    if month in [6, 7, 8]:  # Summer festival season
-        energy_boost = 1.15
-        surprise_likelihood = 0.3
-    elif month in [10, 11, 12]:  # Fall tour season
-        energy_boost = 1.05
-        surprise_likelihood = 0.2
-    else:
-        energy_boost = 1.0
-        surprise_likelihood = 0.15
+    energy_boost = _MONTH_ENERGY_BOOST[month]
+    surprise_likelihood = _MONTH_SURPRISE_LIKELIHOOD[month]
     
     # Venue size estimation (rough heuristic)
     venue_lower = venue_name.lower()
@@ -128,11 +157,11 @@ def analyze_show_context(show_date: datetime, venue_name: str) -> Dict[str, Any]
         "surprise_likelihood": surprise_likelihood,
         "venue_size": venue_size,
         "energy_multiplier": energy_multiplier,
-        "season": "summer" if month in [6,7,8] else "fall" if month in [9,10,11] else "winter" if month in [12,1,2] else "spring"
+        "season": _MONTH_SEASON[month]
     }
 
 
-def calculate_goldilocks_confidence(song: Dict, days_gap: int, context: Dict) -> float:
+def calculate_goldilocks_confidence(song: _Song, days_gap: int, context: Dict) -> float:
     """Enhanced confidence calculation with multiple factors"""
     
     base_confidence = 0.5
@@ -148,7 +177,7 @@ def calculate_goldilocks_confidence(song: Dict, days_gap: int, context: Dict) ->
         gap_score = 0.1
     
     # Historical play frequency
-    play_frequency_score = min(0.2, song["total_plays"] / 1000)
+    play_frequency_score = min(0.2, song.total_plays / 1000)
     
     # Context adjustments
     context_score = 0.1 * (
@@ -159,7 +188,7 @@ def calculate_goldilocks_confidence(song: Dict, days_gap: int, context: Dict) ->
     
     # Energy matching
     energy_match = 0.05
-    if song.get("energy") == "high" and context["energy_boost"] > 1.1:
+    if song.energy == "high" and context["energy_boost"] > 1.1:
         energy_match = 0.1
     
     total_confidence = base_confidence + gap_score + play_frequency_score + context_score + energy_match
@@ -167,25 +196,30 @@ def calculate_goldilocks_confidence(song: Dict, days_gap: int, context: Dict) ->
     # Add small random factor for variety
     total_confidence += random.uniform(-0.05, 0.05)
     
-    return max(0.1, min(0.95, total_confidence))
+    # Clamp to [0.1, 0.95] with inline comparisons rather than min()/max() calls
+    if total_confidence > 0.95:
+        return 0.95
+    if total_confidence < 0.1:
+        return 0.1
+    return total_confidence
 
 
-def generate_opener_predictions(candidates: List[Dict], show_date: datetime, context: Dict) -> List[Dict]:
+def generate_opener_predictions(candidates: Sequence[_Song], show_date: datetime, context: Dict) -> List[Dict]:
     """Generate opener predictions with enhanced logic"""
     
     predictions = []
     
     # Sort by opener rate and apply context
-    candidates = sorted(candidates, key=lambda x: x["opener_rate"], reverse=True)
+    candidates = sorted(candidates, key=attrgetter("opener_rate"), reverse=True)
     
     for song in candidates[:2]:  # Top 2 opener candidates
         # Simulate days since last played based on average gap
-        days_gap = max(1, int(song["avg_gap"] + random.uniform(-10, 15)))
+        days_gap = max(1, int(song.avg_gap + random.uniform(-10, 15)))
         
         confidence = calculate_goldilocks_confidence(song, days_gap, context)
         
         # Boost confidence for strong opener songs
-        confidence += song["opener_rate"] * 0.2
+        confidence += song.opener_rate * 0.2
         
         reasoning = build_reasoning(song, days_gap, "opener", context)
         
@@ -200,21 +234,21 @@ def generate_opener_predictions(candidates: List[Dict], show_date: datetime, con
     return predictions
 
 
-def generate_encore_predictions(candidates: List[Dict], show_date: datetime, context: Dict) -> List[Dict]:
+def generate_encore_predictions(candidates: Sequence[_Song], show_date: datetime, context: Dict) -> List[Dict]:
     """Generate encore predictions with enhanced logic"""
     
     predictions = []
     
     # Sort by encore rate
-    candidates = sorted(candidates, key=lambda x: x["encore_rate"], reverse=True)
+    candidates = sorted(candidates, key=attrgetter("encore_rate"), reverse=True)
     
     for song in candidates[:2]:  # Top 2 encore candidates
-        days_gap = max(1, int(song["avg_gap"] + random.uniform(-10, 15)))
+        days_gap = max(1, int(song.avg_gap + random.uniform(-10, 15)))
         
         confidence = calculate_goldilocks_confidence(song, days_gap, context)
         
         # Boost confidence for strong encore songs
-        confidence += song["encore_rate"] * 0.25
+        confidence += song.encore_rate * 0.25
         
         reasoning = build_reasoning(song, days_gap, "encore", context)
         
@@ -229,52 +263,42 @@ def generate_encore_predictions(candidates: List[Dict], show_date: datetime, con
     return predictions
 
 
-def generate_rotation_predictions(song_database: List[Dict], show_date: datetime, context: Dict) -> List[Dict]:
+def generate_rotation_predictions(song_database: Sequence[_Song], show_date: datetime, context: Dict) -> List[Dict]:
     """Generate rotation candidate predictions"""
     
     predictions = []
     
-    # Filter and score rotation candidates
+    # Score rotation candidates as (score, song, days_gap, confidence) tuples
     rotation_candidates = []
     for song in song_database:
-        days_gap = max(1, int(song["avg_gap"] + random.uniform(-15, 20)))
+        days_gap = max(1, int(song.avg_gap + random.uniform(-15, 20)))
         confidence = calculate_goldilocks_confidence(song, days_gap, context)
-        
-        rotation_candidates.append({
-            "song": song,
-            "days_gap": days_gap,
-            "confidence": confidence,
-            "score": confidence * song["total_plays"] / 100  # Weight by popularity
-        })
-    
-    # Sort by score and take top candidates
-    rotation_candidates.sort(key=lambda x: x["score"], reverse=True)
+        score = confidence * song.total_plays / 100  # Weight by popularity
+        rotation_candidates.append((score, song, days_gap, confidence))
     
-    for candidate in rotation_candidates[:4]:  # Top 4 rotation candidates
-        reasoning = build_reasoning(candidate["song"], candidate["days_gap"], "rotation_candidate", context)
+    # Take the top 4 by score; only those are turned into prediction dicts
+    for _, song, days_gap, confidence in heapq.nlargest(4, rotation_candidates, key=itemgetter(0)):
+        reasoning = build_reasoning(song, days_gap, "rotation_candidate", context)
         
         predictions.append({
-            "song": candidate["song"],
-            "days_gap": candidate["days_gap"],
+            "song": song,
+            "days_gap": days_gap,
             "prediction_type": "rotation_candidate",
-            "confidence": candidate["confidence"],
+            "confidence": confidence,
             "reasoning": reasoning
         })
     
     return predictions
 
 
-def generate_surprise_predictions(song_database: List[Dict], show_date: datetime, context: Dict) -> List[Dict]:
-    """Generate surprise deep cut predictions"""
-    
-    # Focus on songs with very long gaps (100+ days)
-    deep_cuts = [s for s in song_database if s["avg_gap"] > 100]
+def generate_surprise_predictions(deep_cuts: Sequence[_Song], show_date: datetime, context: Dict) -> List[Dict]:
+    """Generate surprise deep cut predictions from the precomputed deep cuts"""
     
     if not deep_cuts:
         return []
     
-    surprise_song = random.choice(deep_cuts)
-    days_gap = max(100, int(surprise_song["avg_gap"] + random.uniform(0, 50)))
+    surprise_song = deep_cuts[random.randrange(len(deep_cuts))]
+    days_gap = max(100, int(surprise_song.avg_gap + random.uniform(0, 50)))
     
     # Lower base confidence but add surprise boost
     confidence = calculate_goldilocks_confidence(surprise_song, days_gap, context) * 0.8
@@ -291,81 +315,117 @@ def generate_surprise_predictions(song_database: List[Dict], show_date: datetime
     }]
 
 
-def build_reasoning(song: Dict, days_gap: int, pred_type: str, context: Dict, is_surprise: bool = False) -> List[str]:
-    """Build comprehensive reasoning for predictions"""
+# Reasoning templates; build_reasoning emits (template_index, args) tokens
+# that are only rendered into strings when the prediction is formatted.
+_REASONING_TEMPLATES = (
+    "🎯 Goldilocks zone - {} days is just right!",
+    "🔥 Deep cut surprise potential - {} days overdue",
+    "⏰ Due for rotation - {} days since last played",
+    "📈 Recent momentum - {} days gap",
+    "📊 Historical plays: {}",
+    "🎤 Strong opener ({:.0%} opener rate)",
+    "🔥 Powerful encore ({:.0%} encore rate)",
+    "🎉 Weekend energy boost",
+    "🌟 {} season energy",
+    "🏟️ Big venue = high energy songs favored",
+    "🎸 Cover of {}",
+    "💥 Surprise factor - expect the unexpected!",
+)
+
+
+def build_reasoning(song: _Song, days_gap: int, pred_type: str, context: Dict, is_surprise: bool = False) -> List[Tuple[int, tuple]]:
+    """Build comprehensive reasoning tokens for predictions (see render_reasoning)"""
     
     reasoning = []
     
     # Core Goldilocks logic
     if 8 <= days_gap <= 30:
-        reasoning.append(f"🎯 Goldilocks zone - {days_gap} days is just right!")
+        reasoning.append((0, (days_gap,)))
     elif days_gap > 300:
-        reasoning.append(f"🔥 Deep cut surprise potential - {days_gap} days overdue")
+        reasoning.append((1, (days_gap,)))
     elif days_gap > 60:
-        reasoning.append(f"⏰ Due for rotation - {days_gap} days since last played")
+        reasoning.append((2, (days_gap,)))
     else:
-        reasoning.append(f"📈 Recent momentum - {days_gap} days gap")
+        reasoning.append((3, (days_gap,)))
     
     # Historical context
-    reasoning.append(f"📊 Historical plays: {song['total_plays']}")
+    reasoning.append((4, (song.total_plays,)))
     
     # Prediction type specific reasoning
-    if pred_type == "opener" and song["opener_rate"] > 0.2:
-        reasoning.append(f"🎤 Strong opener ({song['opener_rate']:.0%} opener rate)")
-    elif pred_type == "encore" and song["encore_rate"] > 0.2:
-        reasoning.append(f"🔥 Powerful encore ({song['encore_rate']:.0%} encore rate)")
+    if pred_type == "opener" and song.opener_rate > 0.2:
+        reasoning.append((5, (song.opener_rate,)))
+    elif pred_type == "encore" and song.encore_rate > 0.2:
+        reasoning.append((6, (song.encore_rate,)))
     
     # Context factors
     if context["weekend_boost"] > 1.0:
-        reasoning.append("🎉 Weekend energy boost")
+        reasoning.append((7, ()))
     
     if context["energy_boost"] > 1.1:
-        reasoning.append(f"🌟 {context['season'].title()} season energy")
+        reasoning.append((8, (context['season'].title(),)))
     
     if context["venue_size"] == "large":
-        reasoning.append("🏟️ Big venue = high energy songs favored")
+        reasoning.append((9, ()))
     
     # Cover song note
-    if song.get("is_cover"):
-        reasoning.append(f"🎸 Cover of {song.get('original_artist', 'unknown')}")
+    if song.is_cover:
+        reasoning.append((10, (song.original_artist,)))
     
     # Surprise note
     if is_surprise:
-        reasoning.append("💥 Surprise factor - expect the unexpected!")
+        reasoning.append((11, ()))
     
     return reasoning
 
 
-def format_prediction(pred_data: Dict, show_data: Dict, rank: int) -> Dict[str, Any]:
-    """Format prediction into proper SetlistPrediction schema"""
+def render_reasoning(tokens: List[Tuple[int, tuple]]) -> List[str]:
+    """Render reasoning tokens from build_reasoning into display strings"""
+    return [_REASONING_TEMPLATES[index].format(*args) for index, args in tokens]
+
+
+# Fields that are the same for every v5 prediction
+_STATIC_PRED_DEFAULTS = {
+    "avg_position": 4.5,
+    "total_shows_analyzed": 500,
+    "cover_percentage": 0.15,
+    "avg_songs_per_show": 12.0,
+}
+
+
+def format_prediction(pred_data: Dict, show_data: Dict, rank: int, created_at: Optional[str] = None,
+                      band_name_lower: Optional[str] = None) -> Dict[str, Any]:
+    """Format prediction into proper SetlistPrediction schema
+
+    created_at and band_name_lower are computed once per batch by the
+    caller; when omitted they are derived here.
+    """
     
     song = pred_data["song"]
     show_date = show_data.get('show_date', '')
     band_name = show_data.get('band_name', 'Goose')
+    if band_name_lower is None:
+        band_name_lower = band_name.lower()
     
     show_date_obj = datetime.strptime(show_date, '%Y-%m-%d')
     last_played_date = show_date_obj - timedelta(days=pred_data["days_gap"])
     
     return {
-        "primary_key": f"{show_date}_{band_name.lower()}_{pred_data['prediction_type']}_{song['name'].replace(' ', '_').replace('(', '').replace(')', '')}_v5",
+        **_STATIC_PRED_DEFAULTS,
+        "primary_key": "_".join((show_date, band_name_lower, pred_data["prediction_type"], song.slug, "v5")),
         "prediction_date": show_date,
         "band_name": band_name,
         "prediction_type": pred_data["prediction_type"],
-        "song_name": song["name"],
+        "song_name": song.name,
         "confidence": pred_data["confidence"],
-        "is_cover": song.get("is_cover", False),
-        "original_artist": song.get("original_artist", "Goose"),
-        "reasoning": pred_data["reasoning"],
+        "is_cover": song.is_cover,
+        "original_artist": song.original_artist,
+        "reasoning": render_reasoning(pred_data["reasoning"]),
         "last_played": last_played_date.strftime('%Y-%m-%d'),
-        "total_plays": song["total_plays"],
-        "avg_position": 4.5,
+        "total_plays": song.total_plays,
         "days_since_played": pred_data["days_gap"],
         "data_through_date": (show_date_obj - timedelta(days=1)).strftime('%Y-%m-%d'),
-        "total_shows_analyzed": 500,
-        "cover_percentage": 0.15,
-        "avg_songs_per_show": 12.0,
         "prediction_rank": rank,
-        "created_at": datetime.now().isoformat()
+        "created_at": created_at or datetime.now().isoformat()
     }
 
 
@@ -376,21 +436,20 @@ def show_to_setlist_prediction_v5(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     Enhanced with historical learning and context awareness
     """
     try:
-        print(f"🚀 Goldilocks v5.0 Enhanced Algorithm triggered for: {data.get('show_date', 'unknown')}")
+        logger.debug("🚀 Goldilocks v5.0 Enhanced Algorithm triggered for: %s", data.get('show_date', 'unknown'))
         
         predictions = goldilocks_v5_predictions(data)
         
         if predictions:
-            print(f"✨ Generated {len(predictions)} enhanced predictions with contextual awareness")
-            for pred in predictions:
-                print(f"  🎵 {pred['song_name']} ({pred['prediction_type']}, {pred['confidence']:.1%})")
+            logger.info("✨ Generated %d enhanced predictions with contextual awareness", len(predictions))
+            if logger.isEnabledFor(logging.DEBUG):
+                for pred in predictions:
+                    logger.debug("  🎵 %s (%s, %.1f%%)", pred['song_name'], pred['prediction_type'], pred['confidence'] * 100)
             return predictions
         else:
-            print("⚠️ No predictions generated")
+            logger.debug("⚠️ No predictions generated")
             return []
         
     except Exception as e:
-        print(f"❌ Goldilocks v5.0 streaming error: {str(e)}")
-        import traceback
-        print(f"Full traceback: {traceback.format_exc()}")
+        logger.exception("❌ Goldilocks v5.0 streaming error: %s", e)
         return [] 
\ No newline at end of file
@@ -31,6 +31,7 @@ class PredictedSetlistEntry(BaseModel):
     total_plays: Optional[int] = Field(None, description="Total historical plays of this song")
     avg_position: Optional[float] = Field(None, description="Average historical position in set")
     
+    # Entries built from one prediction share a single timestamp passed in by the producer
     created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
 
 
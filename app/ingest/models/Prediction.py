@@ -1,7 +1,8 @@
 from moose_lib import IngestPipeline, IngestPipelineConfig, OlapConfig
 from datetime import datetime, UTC
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+import orjson
 
 
 class Prediction(BaseModel):
@@ -31,6 +32,14 @@ class Prediction(BaseModel):
     prediction_notes: Optional[str] = Field(None, description="Any notes about this prediction")
     created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
 
+    @field_validator("setlist_entries", mode="before")
+    @classmethod
+    def parse_setlist_entries(cls, value: Any) -> Any:
+        """Accept a JSON string at ingest and store it as a list, parsed once"""
+        if isinstance(value, (str, bytes)):
+            return orjson.loads(value)
+        return value
+
 
 # Create ingest pipeline with ordering
 prediction_pipeline = IngestPipeline[Prediction]("Prediction", IngestPipelineConfig(
@@ -1,8 +1,10 @@
 from moose_lib import IngestPipeline, IngestPipelineConfig, OlapConfig
 from datetime import datetime, UTC
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Sequence
 from pydantic import Json
 from pydantic import BaseModel, Field
+import orjson
 
 
 class Show(BaseModel):
@@ -21,6 +23,23 @@ class Show(BaseModel):
     created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
 
 
+@lru_cache(maxsize=128)
+def _parse_setlist_json(raw: str) -> tuple:
+    return tuple(orjson.loads(raw))
+
+
+def load_setlist_entries(setlist_entries: Any) -> Sequence[Dict[str, Any]]:
+    """
+    Parse a Show's embedded setlist_entries JSON.
+    
+    Several transforms consume the same Show record, so parses are cached per
+    JSON string; callers must treat the returned entries as read-only.
+    """
+    if isinstance(setlist_entries, str):
+        return _parse_setlist_json(setlist_entries)
+    return setlist_entries
+
+
 # Create ingest pipeline with ordering
 show_pipeline = IngestPipeline[Show]("Show", IngestPipelineConfig(
     ingest=True,   # API endpoint for ingesting show data
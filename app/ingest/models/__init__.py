@@ -2,7 +2,7 @@
 Data models for the setlist prediction system.
 """
 
-from app.ingest.models.Show import Show, show_pipeline
+from app.ingest.models.Show import Show, show_pipeline, load_setlist_entries
 from app.ingest.models.SetlistEntry import SetlistEntry, SetType, setlist_entry_pipeline
 from app.ingest.models.Prediction import Prediction, prediction_pipeline
 from app.ingest.models.PredictedSetlistEntry import PredictedSetlistEntry, predicted_setlist_entry_pipeline
@@ -11,6 +11,7 @@ from app.ingest.models.PredictionMetadata import PredictionMetadata, PredictionT
 __all__ = [
     'Show',
     'show_pipeline',
+    'load_setlist_entries',
     'SetlistEntry',
     'SetType',
     'setlist_entry_pipeline',
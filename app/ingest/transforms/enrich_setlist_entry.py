@@ -1,3 +1,4 @@
+import re
 from app.ingest.models.SetlistEntry import setlist_entry_pipeline, SetlistEntry
 from moose_lib import DeadLetterQueue, TransformConfig
 
@@ -5,6 +6,11 @@ from moose_lib import DeadLetterQueue, TransformConfig
 # Dead letter queue for failed setlist entries
 setlist_dlq = DeadLetterQueue[SetlistEntry](name="SetlistEntryDead")
 
+# Keywords detected in lower-cased song names, and their bits in the name mask
+_TOKEN_RE = re.compile(r"jam|tease|partial")
+_JAM, _TEASE, _PARTIAL, _TRANSITION = 1, 2, 4, 8
+_TOKEN_BITS = {"jam": _JAM, "tease": _TEASE, "partial": _PARTIAL}
+
 
 def enrich_setlist_entry(entry: SetlistEntry) -> SetlistEntry:
     """
@@ -19,29 +25,45 @@ def enrich_setlist_entry(entry: SetlistEntry) -> SetlistEntry:
     # Basic song name standardization
     standardized_name = entry.song_name.strip()
     
+    # Lower-case once and fold every keyword hit (plus ">") into one bitmask
+    mask = _TRANSITION if ">" in standardized_name else 0
+    for token in _TOKEN_RE.findall(standardized_name.lower()):
+        mask |= _TOKEN_BITS[token]
+    
+    # Every operand below is a bool, so the chains short-circuit to a bool
+    # without a bool() wrapper; cheapest checks come first.
+    
     # Detect jams from song names (common patterns) - preserve original or detect new
-    is_jam = bool(
+    is_jam = (
         entry.is_jam or  # Preserve original value
-        "jam" in standardized_name.lower() or
-        ">" in standardized_name or
+        (mask & (_JAM | _TRANSITION)) != 0 or
         (entry.song_duration_minutes is not None and entry.song_duration_minutes > 20)
     )
     
     # Detect teases - preserve original or detect new
-    is_tease = bool(entry.is_tease or "tease" in standardized_name.lower())
+    is_tease = entry.is_tease or (mask & _TEASE) != 0
     
     # Detect partial performances - preserve original or detect new  
-    is_partial = bool(entry.is_partial or "partial" in standardized_name.lower() or ">" in standardized_name)
+    is_partial = entry.is_partial or (mask & (_PARTIAL | _TRANSITION)) != 0
     
-    # Create enriched entry
-    enriched_entry = entry.model_copy()
-    enriched_entry.song_name = standardized_name
-    enriched_entry.is_jam = is_jam
-    enriched_entry.is_tease = is_tease
-    enriched_entry.is_partial = is_partial
-    enriched_entry.is_enriched = True  # Mark as enriched
+    # Nothing to change besides the flag: mark the entry and reuse it as-is
+    if (standardized_name == entry.song_name and is_jam == entry.is_jam
+            and is_tease == entry.is_tease and is_partial == entry.is_partial):
+        entry.is_enriched = True
+        return entry
+    
+    # Create enriched entry. Stream records were already validated at ingest
+    # and SetlistEntry has no computed fields, so skip re-validation.
+    data = entry.__dict__.copy()
+    data.update(
+        song_name=standardized_name,
+        is_jam=is_jam,
+        is_tease=is_tease,
+        is_partial=is_partial,
+        is_enriched=True,  # Mark as enriched
+    )
     
-    return enriched_entry
+    return SetlistEntry.model_construct(**data)
 
 
 # DISABLED - This transform causes duplicates when writing back to the same pipeline
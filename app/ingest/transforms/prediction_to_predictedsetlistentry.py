@@ -3,9 +3,53 @@ Transform function: Prediction -> PredictedSetlistEntry
 Extracts embedded predicted setlist entries from Prediction records.
 """
 
+import logging
 from typing import List, Dict, Any
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+
+# Fields copied from each embedded entry, with the defaults used when missing
+_ENTRY_DEFAULTS = {
+    'set_type': 'Set 1',
+    'set_position': 1,
+    'song_name': '',
+    'is_cover': False,
+    'original_artist': None,
+    'confidence': 0.5,
+    'reasoning': None,
+    'prediction_type': None,
+    'last_played': None,
+    'days_since_played': None,
+    'total_plays': None,
+    'avg_position': None,
+}
+_ENTRY_FIELDS = _ENTRY_DEFAULTS.keys()
+
+
+def _build_entry(entry_data: Dict[str, Any], prediction_id: str, band_name: str,
+                 show_date: str, created_at: str) -> Dict[str, Any]:
+    """Build one PredictedSetlistEntry record from an embedded entry"""
+    # Only format a fallback key when the entry doesn't carry one
+    if 'primary_key' in entry_data:
+        primary_key = entry_data['primary_key']
+    else:
+        primary_key = f"{prediction_id}_{entry_data.get('set_type', 'unknown')}_{entry_data.get('set_position', 0):03d}"
+    
+    row = {
+        'primary_key': primary_key,
+        'prediction_id': prediction_id,
+        'band_name': band_name,
+        'show_date': show_date,
+        **_ENTRY_DEFAULTS,
+        'created_at': created_at,
+    }
+    # Overlay only the known fields the entry provides (it may carry extras)
+    for key in _ENTRY_FIELDS & entry_data.keys():
+        row[key] = entry_data[key]
+    return row
+
 
 def prediction_to_predictedsetlistentry(prediction: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
@@ -19,41 +63,22 @@ def prediction_to_predictedsetlistentry(prediction: Dict[str, Any]) -> List[Dict
         List of PredictedSetlistEntry records
     """
     # If no embedded entries, return empty list
-    if not prediction.get('setlist_entries'):
+    setlist_entries = prediction.get('setlist_entries')
+    if not setlist_entries:
         return []
     
-    entries = []
     prediction_id = prediction.get('primary_key', '')
     band_name = prediction.get('band_name', '')
     show_date = prediction.get('show_date', '')
+    created_at = datetime.now().isoformat()  # One timestamp for the whole prediction
     
     # Process each embedded entry
-    for entry_data in prediction.get('setlist_entries', []):
-        # Create the PredictedSetlistEntry record
-        entry = {
-            'primary_key': entry_data.get('primary_key', f"{prediction_id}_{entry_data.get('set_type', 'unknown')}_{entry_data.get('set_position', 0):03d}"),
-            'prediction_id': prediction_id,
-            'band_name': band_name,
-            'show_date': show_date,
-            'set_type': entry_data.get('set_type', 'Set 1'),
-            'set_position': entry_data.get('set_position', 1),
-            'song_name': entry_data.get('song_name', ''),
-            'is_cover': entry_data.get('is_cover', False),
-            'original_artist': entry_data.get('original_artist'),
-            'confidence': entry_data.get('confidence', 0.5),
-            'reasoning': entry_data.get('reasoning'),
-            'prediction_type': entry_data.get('prediction_type'),
-            'last_played': entry_data.get('last_played'),
-            'days_since_played': entry_data.get('days_since_played'),
-            'total_plays': entry_data.get('total_plays'),
-            'avg_position': entry_data.get('avg_position'),
-            'created_at': datetime.now().isoformat()
-        }
-        
-        entries.append(entry)
+    entries = [
+        _build_entry(entry_data, prediction_id, band_name, show_date, created_at)
+        for entry_data in setlist_entries
+    ]
     
     # Log the transformation
-    if entries:
-        print(f"🔮 Extracted {len(entries)} predicted songs from prediction {prediction_id}")
+    logger.info("Extracted %d predicted songs from prediction %s", len(entries), prediction_id)
     
     return entries
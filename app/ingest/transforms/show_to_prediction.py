@@ -3,12 +3,101 @@ Transform function: Show -> Prediction
 When a show is ingested, generate predictions for the next show using Goldilocks algorithm.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta, UTC
-import json
+import functools
+import logging
+import threading
+import time
+import orjson
+import requests
 from app.ingest.models import Show, Prediction
 from app.functions.goldilocks_v8_algorithm import goldilocks_v8_predictions
 
+logger = logging.getLogger(__name__)
+
+# Shared keep-alive session for the local consumption API, so consecutive
+# shows reuse pooled connections instead of opening new ones per request
+CONSUMPTION_API_URL = "http://localhost:4000/consumption"
+_http = requests.Session()
+
+# Recent prediction runs per (band_name, next_show_date), used for debouncing
+PREDICTION_DEBOUNCE_SECONDS = 60
+_recent_runs: Dict[Tuple[str, str], float] = {}
+_recent_runs_lock = threading.Lock()
+
+
+# Historical song lists are reused for up to this long, so a burst of shows for one
+# band makes a single API call while later shows still see new setlists
+HISTORICAL_SONGS_TTL_SECONDS = 60
+
+
+def fetch_historical_songs(band_name: str) -> Tuple[str, ...]:
+    """
+    Unique song names from the band's recent setlist entries.
+    
+    Results are cached per band for up to HISTORICAL_SONGS_TTL_SECONDS. Failed
+    requests raise and are not cached.
+    """
+    return _fetch_historical_songs(band_name, int(time.monotonic() // HISTORICAL_SONGS_TTL_SECONDS))
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch_historical_songs(band_name: str, time_bucket: int) -> Tuple[str, ...]:
+    """Query the consumption API; time_bucket only partitions the cache"""
+    resp = _http.get(
+        f"{CONSUMPTION_API_URL}/setlists",
+        params={"band_name": band_name, "limit": 500}
+    )
+    resp.raise_for_status()
+    entries = orjson.loads(resp.content).get('items', [])
+    # dict.fromkeys dedupes in one pass and keeps first-seen order
+    return tuple(dict.fromkeys(e['song_name'] for e in entries if e.get('song_name')))
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_show_date(value: str) -> Optional[datetime]:
+    """
+    Parse a show date, or return None if it isn't a recognisable date.
+    
+    show_date is documented as YYYY-MM-DD, so that shape is sliced directly;
+    full ISO timestamps (including a trailing Z) go through fromisoformat.
+    """
+    try:
+        if len(value) == 10 and value[4] == value[7] == '-':
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
+
+
+def claim_prediction_run(band_name: str, next_show_date: str) -> bool:
+    """
+    Debounce prediction runs per (band_name, next_show_date).
+    
+    Returns True if the caller should run the algorithm, or False if a run for
+    the same key started within PREDICTION_DEBOUNCE_SECONDS (e.g. a backfill
+    replaying several shows for the same band).
+    """
+    key = (band_name, next_show_date)
+    now = time.monotonic()
+    with _recent_runs_lock:
+        last_run = _recent_runs.get(key)
+        if last_run is not None and now - last_run < PREDICTION_DEBOUNCE_SECONDS:
+            return False
+        if len(_recent_runs) >= 1024:
+            # Drop expired keys so the map stays bounded
+            for stale in [k for k, t in _recent_runs.items() if now - t >= PREDICTION_DEBOUNCE_SECONDS]:
+                del _recent_runs[stale]
+        _recent_runs[key] = now
+    return True
+
+
+def release_prediction_run(band_name: str, next_show_date: str) -> None:
+    """Forget a claimed run that produced no prediction, so a retry isn't debounced"""
+    with _recent_runs_lock:
+        _recent_runs.pop((band_name, next_show_date), None)
+
 
 def show_to_prediction(show: Show) -> Optional[Prediction]:
     """
@@ -26,68 +115,61 @@ def show_to_prediction(show: Show) -> Optional[Prediction]:
     Returns:
         Prediction record for the next show, or None if no prediction needed
     """
-    print(f"🔮 Prediction transform triggered for show: {show.band_name} on {show.show_date}")
+    logger.debug("Prediction transform triggered for show: %s on %s", show.band_name, show.show_date)
     
     # Parse the show date
-    try:
-        show_date = datetime.fromisoformat(show.show_date.replace('Z', '+00:00'))
-    except:
-        try:
-            show_date = datetime.strptime(show.show_date, "%Y-%m-%d")
-        except:
-            print(f"  ❌ Could not parse show date: {show.show_date}")
-            return None
+    show_date = parse_show_date(show.show_date)
+    if show_date is None:
+        logger.error("Could not parse show date: %s", show.show_date)
+        return None
     
     # Generate prediction for the next day (typical tour pattern)
     # In a real scenario, you'd look up the actual next show date from the tour schedule
     next_show_date = show_date + timedelta(days=1)
     next_show_date_str = next_show_date.strftime("%Y-%m-%d")
     
+    # Skip if we just ran the algorithm for this band and target date
+    if not claim_prediction_run(show.band_name, next_show_date_str):
+        logger.debug("Predictions for %s already generated in the last %ss", next_show_date_str, PREDICTION_DEBOUNCE_SECONDS)
+        return None
+    
     # For now, use placeholder venue info (in production, look up from tour schedule)
     # TODO: Query the database for the actual next show's venue
     next_venue_name = "Unknown Venue"
     next_venue_city = "Unknown City"
     next_venue_state = "XX"
     
-    print(f"  📅 Generating predictions for next show: {next_show_date_str}")
+    logger.debug("Generating predictions for next show: %s", next_show_date_str)
     
+    prediction = None
     try:
         # Check how many shows we have in the database for historical context
-        import requests
-        response = requests.get(
-            f"http://localhost:4000/consumption/shows",
+        response = _http.get(
+            f"{CONSUMPTION_API_URL}/shows",
             params={"band_name": show.band_name, "limit": 1000}
         )
         
         historical_shows_count = 0
         if response.status_code == 200:
-            historical_shows_count = len(response.json().get('shows', []))
+            historical_shows_count = len(orjson.loads(response.content).get('shows', []))
         
-        print(f"  📊 Historical shows available: {historical_shows_count}")
+        logger.debug("Historical shows available: %d", historical_shows_count)
         
         # Minimum threshold for predictions (can be tuned)
         MIN_SHOWS_FOR_PREDICTIONS = 5
         
         if historical_shows_count < MIN_SHOWS_FOR_PREDICTIONS:
-            print(f"  ℹ️ Need at least {MIN_SHOWS_FOR_PREDICTIONS} shows for predictions (have {historical_shows_count})")
-            print(f"     Predictions will start after more shows are ingested")
+            logger.info("Need at least %d shows for predictions (have %d); predictions will start after more shows are ingested",
+                        MIN_SHOWS_FOR_PREDICTIONS, historical_shows_count)
             return None
         
         # Get historical songs for the algorithm
-        historical_songs = []
+        historical_songs = ()
         try:
-            # Query for recent setlist entries
-            import requests as req
-            resp = req.get(
-                f"http://localhost:4000/consumption/setlists",
-                params={"band_name": show.band_name, "limit": 500}
-            )
-            if resp.status_code == 200:
-                entries = resp.json().get('items', [])
-                historical_songs = list(set(e['song_name'] for e in entries if e.get('song_name')))
-                print(f"  📚 Found {len(historical_songs)} unique historical songs")
+            historical_songs = fetch_historical_songs(show.band_name)
+            logger.debug("Found %d unique historical songs", len(historical_songs))
         except Exception as e:
-            print(f"  ⚠️ Could not get historical songs: {e}")
+            logger.warning("Could not get historical songs: %s", e)
         
         # Call Goldilocks v8 algorithm
         predictions = goldilocks_v8_predictions(
@@ -100,19 +182,20 @@ def show_to_prediction(show: Show) -> Optional[Prediction]:
         )
         
         if not predictions:
-            print(f"  ⚠️ No predictions generated (algorithm may need more data)")
+            logger.warning("No predictions generated for %s (algorithm may need more data)", next_show_date_str)
             return None
         
         # Add metadata about prediction quality based on data availability
         confidence_boost = min(1.0, historical_shows_count / 50)  # Max confidence at 50+ shows
-        print(f"  📈 Confidence factor: {confidence_boost:.1%} (based on {historical_shows_count} shows)")
+        logger.debug("Confidence factor: %.1f%% (based on %d shows)", confidence_boost * 100, historical_shows_count)
         
         # Create Prediction record with embedded setlist entries
         # Adjust confidence based on available data
         base_confidence = sum(p.get('confidence', 0.5) for p in predictions) / len(predictions)
         adjusted_confidence = base_confidence * confidence_boost
         
-        prediction = Prediction(
+        # Every field is produced here with the right type, so skip validation
+        prediction = Prediction.model_construct(
             band_name=show.band_name,
             show_date=next_show_date_str,
             venue_name=next_venue_name,
@@ -127,20 +210,26 @@ def show_to_prediction(show: Show) -> Optional[Prediction]:
             setlist_entries=predictions  # Embed predictions as list of dicts
         )
         
-        print(f"  ✅ Generated {len(predictions)} predictions for {next_show_date_str}")
-        print(f"  📊 Average confidence: {prediction.confidence_score:.1%}")
+        logger.info("Generated %d predictions for %s (average confidence %.1f%%)",
+                    len(predictions), next_show_date_str, prediction.confidence_score * 100)
         
         # Show top 3 predictions
-        for i, pred in enumerate(predictions[:3], 1):
-            print(f"     {i}. {pred['song_name']} ({pred.get('confidence', 0.5):.1%} confidence)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Top predictions:\n%s", "\n".join(
+                f"  {i}. {pred['song_name']} ({pred.get('confidence', 0.5):.1%} confidence)"
+                for i, pred in enumerate(predictions[:3], 1)
+            ))
         
         return prediction
         
     except Exception as e:
-        print(f"  ❌ Error generating predictions: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error generating predictions: %s", e)
         return None
+    
+    finally:
+        # Only a run that built a Prediction keeps its debounce claim
+        if prediction is None:
+            release_prediction_run(show.band_name, next_show_date_str)
 
 
 # Register the transform from Show to Prediction
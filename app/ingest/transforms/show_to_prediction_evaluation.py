@@ -3,10 +3,44 @@ Transform function: Show -> PredictionMetadata
 When a show is ingested, evaluate any predictions we had for this show.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, UTC
+from itertools import islice
+import logging
+import time
 import requests
-from app.ingest.models import Show, PredictionMetadata, Prediction, PredictedSetlistEntry
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from app.ingest.models import Show, PredictionMetadata, Prediction, PredictedSetlistEntry, load_setlist_entries
+
+logger = logging.getLogger(__name__)
+
+# Small pool used to issue the evaluation's API lookups in parallel
+FETCH_WORKERS = 2
+_fetch_pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="evaluation-fetch")
+
+
+def _build_session() -> requests.Session:
+    """Keep-alive session for the consumption API lookups, pooled for the fetch threads"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=FETCH_WORKERS,
+        max_retries=Retry(total=3, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    return session
+
+
+_session = _build_session()
+
+# In-process cache of prediction lookups per (band_name, show_date). Shows
+# with no prediction are remembered briefly so replays skip the HTTP calls;
+# a prediction for a date is written when the previous show is ingested, so
+# it normally exists before this lookup and a short negative TTL is safe.
+PREDICTION_CACHE_TTL_SECONDS = 3600
+NO_PREDICTION_TTL_SECONDS = 300
+_prediction_cache: Dict[Tuple[str, str], Tuple[float, Tuple[Any, Any]]] = {}
 
 
 def calculate_prediction_accuracy(predicted_entries: List[PredictedSetlistEntry], actual_songs: List[str]) -> Dict[str, float]:
@@ -27,8 +61,9 @@ def calculate_prediction_accuracy(predicted_entries: List[PredictedSetlistEntry]
     # Extract predicted song names from PredictedSetlistEntry objects
     predicted_songs = [entry.song_name for entry in predicted_entries if entry.song_name]
     
-    # Calculate metrics
-    exact_matches = sum(1 for song in predicted_songs if song in actual_songs)
+    # Calculate metrics (hash lookups against the actual setlist)
+    actual_set = set(actual_songs)
+    exact_matches = sum(1 for song in predicted_songs if song in actual_set)
     
     # Precision: What % of our predictions were correct?
     precision = exact_matches / len(predicted_songs) if predicted_songs else 0.0
@@ -50,6 +85,46 @@ def calculate_prediction_accuracy(predicted_entries: List[PredictedSetlistEntry]
     }
 
 
+def fetch_consumption_items(endpoint: str, params: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """GET a consumption API endpoint and return its items, or None on a non-200 response"""
+    response = _session.get(f"http://localhost:4000/consumption/{endpoint}", params=params)
+    if response.status_code != 200:
+        return None
+    return response.json().get('items', [])
+
+
+def fetch_prediction_bundle(band_name: str, show_date: str) -> Tuple[Optional[List[Dict[str, Any]]], Optional[List[Dict[str, Any]]]]:
+    """
+    Fetch (prediction items, predicted entry items) for a show, cache-aside.
+    
+    Both API requests are issued concurrently. Complete results are cached in
+    process for PREDICTION_CACHE_TTL_SECONDS and confirmed "no prediction"
+    answers for NO_PREDICTION_TTL_SECONDS, so replays and backfills of the
+    same show skip the round trips; failed requests are never cached.
+    """
+    key = (band_name, show_date)
+    cached = _prediction_cache.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    
+    show_params = {"band_name": band_name, "show_date": show_date}
+    prediction_future = _fetch_pool.submit(fetch_consumption_items, "predictions", {**show_params, "limit": 1})
+    entries_future = _fetch_pool.submit(fetch_consumption_items, "predicted_entries", {**show_params, "limit": 50})
+    bundle = (prediction_future.result(), entries_future.result())
+    
+    if bundle[0] and bundle[1] is not None:
+        ttl = PREDICTION_CACHE_TTL_SECONDS
+    elif bundle[0] == []:
+        ttl = NO_PREDICTION_TTL_SECONDS
+    else:
+        return bundle
+    
+    if len(_prediction_cache) >= 1024:
+        _prediction_cache.clear()
+    _prediction_cache[key] = (time.monotonic() + ttl, bundle)
+    return bundle
+
+
 def show_to_prediction_evaluation(show: Show) -> Optional[PredictionMetadata]:
     """
     Evaluate predictions for this show when it's ingested.
@@ -65,58 +140,38 @@ def show_to_prediction_evaluation(show: Show) -> Optional[PredictionMetadata]:
     Returns:
         PredictionMetadata with evaluation results, or None if no predictions found
     """
-    print(f"📊 Evaluation transform triggered for show: {show.band_name} on {show.show_date}")
+    logger.debug("Evaluation transform triggered for show: %s on %s", show.band_name, show.show_date)
     
     try:
-        # Query for predictions we made for this show
-        # Using the consumption API to get predictions
-        response = requests.get(
-            f"http://localhost:4000/consumption/predictions",
-            params={
-                "band_name": show.band_name,
-                "show_date": show.show_date,
-                "limit": 1
-            }
-        )
-        
-        if response.status_code != 200 or not response.json().get('items'):
-            print(f"  ℹ️ No predictions found for this show")
+        # Query for the prediction we made for this show and its predicted entries
+        prediction_items, entries_data = fetch_prediction_bundle(show.band_name, show.show_date)
+        if not prediction_items:
+            logger.debug("No predictions found for %s on %s", show.band_name, show.show_date)
             return None
         
-        prediction_data = response.json()['items'][0]
+        prediction_data = prediction_items[0]
         
         # Get the actual setlist from the show
         actual_songs = []
         if show.setlist_entries:
-            import json
             try:
-                entries = json.loads(show.setlist_entries) if isinstance(show.setlist_entries, str) else show.setlist_entries
+                entries = load_setlist_entries(show.setlist_entries)
                 actual_songs = [entry.get('song_name', '') for entry in entries]
             except:
-                print(f"  ❌ Could not parse setlist entries")
+                logger.error("Could not parse setlist entries for %s on %s", show.band_name, show.show_date)
                 return None
         
-        # Get predicted songs - convert from API response to objects
+        # Get predicted songs - convert from API response to objects. Rows come
+        # from our own PredictedSetlistEntry table, so skip re-validating them;
+        # only song_name is read downstream.
         predicted_entries = []
-        response = requests.get(
-            f"http://localhost:4000/consumption/predicted_entries",
-            params={
-                "band_name": show.band_name,
-                "show_date": show.show_date,
-                "limit": 50
-            }
-        )
         
-        if response.status_code == 200:
-            entries_data = response.json().get('items', [])
-            # Convert dict responses to PredictedSetlistEntry objects
-            for entry_dict in entries_data:
-                try:
-                    predicted_entry = PredictedSetlistEntry(**entry_dict)
-                    predicted_entries.append(predicted_entry)
-                except Exception as e:
-                    print(f"  ⚠️ Could not parse predicted entry: {e}")
-                    continue
+        if entries_data is not None:
+            predicted_entries = [
+                PredictedSetlistEntry.model_construct(**entry_dict)
+                for entry_dict in entries_data
+                if entry_dict.get('song_name')
+            ]
         
         # Calculate accuracy metrics
         accuracy_metrics = calculate_prediction_accuracy(predicted_entries, actual_songs)
@@ -134,11 +189,11 @@ def show_to_prediction_evaluation(show: Show) -> Optional[PredictionMetadata]:
         elif accuracy_metrics['recall'] < 0.05:
             insights.append(f"Poor coverage: Only predicted {accuracy_metrics['recall']:.1%} of actual songs")
         
-        # Find surprises (songs we didn't predict)
+        # Find the first few surprises (songs we didn't predict), in setlist order
         predicted_song_names = {entry.song_name for entry in predicted_entries if entry.song_name}
-        surprises = [song for song in actual_songs if song not in predicted_song_names]
+        surprises = list(islice((song for song in actual_songs if song not in predicted_song_names), 3))
         if surprises:
-            insights.append(f"Surprise songs: {', '.join(surprises[:3])}")
+            insights.append(f"Surprise songs: {', '.join(surprises)}")
         
         # Create evaluation metadata
         metadata = PredictionMetadata(
@@ -157,23 +212,20 @@ def show_to_prediction_evaluation(show: Show) -> Optional[PredictionMetadata]:
             created_at=datetime.now(UTC).isoformat()
         )
         
-        print(f"  ✅ Evaluation complete:")
-        print(f"     - Precision: {accuracy_metrics['precision']:.1%}")
-        print(f"     - Recall: {accuracy_metrics['recall']:.1%}")
-        print(f"     - F1 Score: {accuracy_metrics['f1_score']:.2f}")
-        print(f"     - Exact matches: {accuracy_metrics['exact_matches']}/{accuracy_metrics['total_predictions']}")
+        logger.info(
+            "Evaluation complete for %s on %s: precision %.1f%%, recall %.1f%%, F1 %.2f, exact matches %d/%d",
+            show.band_name, show.show_date,
+            accuracy_metrics['precision'] * 100, accuracy_metrics['recall'] * 100,
+            accuracy_metrics['f1_score'], accuracy_metrics['exact_matches'], accuracy_metrics['total_predictions'],
+        )
         
         if insights:
-            print(f"  💡 Insights:")
-            for insight in insights[:3]:
-                print(f"     - {insight}")
+            logger.debug("Insights:\n%s", "\n".join(f"  - {insight}" for insight in insights[:3]))
         
         return metadata
         
     except Exception as e:
-        print(f"  ❌ Error evaluating predictions: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error evaluating predictions: %s", e)
         return None
 
 
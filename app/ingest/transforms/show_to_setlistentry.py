@@ -5,9 +5,37 @@ Extracts embedded setlist entries from Show records and creates individual Setli
 
 from typing import List, Dict, Any
 from datetime import datetime, UTC
-import json
-import hashlib
-from app.ingest.models import Show, SetlistEntry
+import logging
+import zlib
+import orjson
+from pydantic import TypeAdapter
+from app.ingest.models import Show, SetlistEntry, load_setlist_entries
+
+logger = logging.getLogger(__name__)
+
+
+# Fields copied from each embedded entry, with the defaults used when missing
+_ENTRY_DEFAULTS = {
+    'set_type': 'Set 1',
+    'set_position': 1,
+    'song_name': '',
+    'song_duration_minutes': None,
+    'transitions_into': None,
+    'transitions_from': None,
+    'is_jam': False,
+    'is_tease': False,
+    'is_partial': False,
+    'is_cover': False,
+    'original_artist': None,
+    'performance_notes': None,
+    'guest_musicians': None,
+}
+_ENTRY_FIELDS = _ENTRY_DEFAULTS.keys()
+
+# Embedded entries are untrusted JSON, so every row is validated; one adapter
+# validates a whole show's rows in a single call
+_ENTRY_LIST_ADAPTER = TypeAdapter(List[SetlistEntry])
+
 
 def show__setlistentry(show: Show) -> List[SetlistEntry]:
     """
@@ -20,67 +48,56 @@ def show__setlistentry(show: Show) -> List[SetlistEntry]:
     Returns:
         List of SetlistEntry records
     """
-    print(f"🎭 Transform triggered for Show: {show.band_name} on {show.show_date}")
+    logger.debug("Transform triggered for Show: %s on %s", show.band_name, show.show_date)
     
-    # Create a unique hash for this show to detect if it's being processed multiple times
-    show_hash = hashlib.md5(f"{show.band_name}_{show.show_date}_{show.venue_name}_{id(show)}".encode()).hexdigest()[:8]
-    print(f"  📍 Transform execution ID: {show_hash} at {datetime.now(UTC).isoformat()}")
+    # Fingerprint the show to spot repeated processing (debug only)
+    if logger.isEnabledFor(logging.DEBUG):
+        show_hash = zlib.crc32(f"{show.band_name}_{show.show_date}_{show.venue_name}".encode())
+        logger.debug("Transform execution ID: %08x at %s", show_hash, datetime.now(UTC).isoformat())
     
     # If no embedded entries, return empty list
     if not show.setlist_entries:
-        print(f"  ⚠️ No setlist_entries found in Show")
+        logger.warning("No setlist_entries found in Show %s on %s", show.band_name, show.show_date)
         return []
     
     # Parse JSON string if needed
     try:
-        if isinstance(show.setlist_entries, str):
-            setlist_data = json.loads(show.setlist_entries)
-        else:
-            setlist_data = show.setlist_entries
-    except (json.JSONDecodeError, TypeError) as e:
-        print(f"  ❌ Error parsing setlist_entries: {e}")
+        setlist_data = load_setlist_entries(show.setlist_entries)
+    except (orjson.JSONDecodeError, TypeError) as e:
+        logger.error("Error parsing setlist_entries for %s on %s: %s", show.band_name, show.show_date, e)
         return []
     
-    entries = []
+    rows = []
+    # All entries extracted from one show share its transform timestamp
+    created_timestamp = datetime.now(UTC).isoformat()
     
     # Process each embedded entry
     for entry_data in setlist_data:
-        # Create the SetlistEntry record with a unique transform execution ID
-        # This helps identify if the same entry is being created multiple times
-        created_timestamp = datetime.now(UTC).isoformat()
-        
-        entry = SetlistEntry(
-            band_name=show.band_name,
-            show_date=show.show_date,
-            venue_name=show.venue_name,
-            tour_name=show.tour_name,
-            set_type=entry_data.get('set_type', 'Set 1'),
-            set_position=entry_data.get('set_position', 1),
-            song_name=entry_data.get('song_name', ''),
-            song_duration_minutes=entry_data.get('song_duration_minutes'),
-            transitions_into=entry_data.get('transitions_into'),
-            transitions_from=entry_data.get('transitions_from'),
-            is_jam=entry_data.get('is_jam', False),
-            is_tease=entry_data.get('is_tease', False),
-            is_partial=entry_data.get('is_partial', False),
-            is_cover=entry_data.get('is_cover', False),
-            original_artist=entry_data.get('original_artist'),
-            performance_notes=entry_data.get('performance_notes'),
-            guest_musicians=entry_data.get('guest_musicians'),
-            is_enriched=False,  # New entries haven't been enriched yet
-            created_at=created_timestamp
-        )
-        
-        entries.append(entry)
+        row = {
+            'band_name': show.band_name,
+            'show_date': show.show_date,
+            'venue_name': show.venue_name,
+            'tour_name': show.tour_name,
+            **_ENTRY_DEFAULTS,
+            'is_enriched': False,  # New entries haven't been enriched yet
+            'created_at': created_timestamp,
+        }
+        # Overlay only the known fields the entry provides (it may carry extras)
+        for key in _ENTRY_FIELDS & entry_data.keys():
+            row[key] = entry_data[key]
+        rows.append(row)
+    
+    # Invalid rows raise ValidationError, which sends the show to the dead letter queue
+    entries = _ENTRY_LIST_ADAPTER.validate_python(rows)
     
     # Log the transformation
-    print(f"  ✅ Extracted {len(entries)} setlist entries from {show.band_name} show on {show.show_date}")
+    logger.info("Extracted %d setlist entries from %s show on %s", len(entries), show.band_name, show.show_date)
     
     # Debug: Show first few entries
-    if entries:
-        print(f"  📝 First 3 entries created:")
-        for i, entry in enumerate(entries[:3], 1):
-            print(f"     {i}. {entry.set_type} - {entry.song_name[:50]}")
+    if entries and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("First 3 entries created:\n%s", "\n".join(
+            f"  {i}. {entry.set_type} - {entry.song_name[:50]}" for i, entry in enumerate(entries[:3], 1)
+        ))
     
     return entries
 
@@ -1,6 +1,12 @@
 # Setlist Analytics - Moose Project
 # Ingest and analyze concert setlist data from various bands
 
+import logging
+import os
+
+# Configure logging once for the app; set LOG_LEVEL=DEBUG to see per-event logs
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
+
 # Import models and transforms (required for Moose to discover them)
 import app.ingest.models
 import app.ingest.transforms
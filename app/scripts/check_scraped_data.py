@@ -1,8 +1,13 @@
 # Check Scraped Data Quality
 # Quick utility to inspect scraped setlist data
 
-import json
+import orjson
 import os
+import re
+from collections import Counter
+
+# Words that mark scraped page chrome rather than song names
+_NON_SONG_RE = re.compile(r"home|login|copyright|powered by|built in")
 
 def check_scraped_data(filepath: str = "data/goose_setlists.json"):
     """Check the quality of scraped setlist data"""
@@ -11,8 +16,8 @@ def check_scraped_data(filepath: str = "data/goose_setlists.json"):
         print(f"❌ File not found: {filepath}")
         return
     
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        data = orjson.loads(f.read())
     
     print("🔍 SCRAPED DATA QUALITY CHECK")
     print("=" * 40)
@@ -44,21 +49,17 @@ def check_scraped_data(filepath: str = "data/goose_setlists.json"):
                 print(f"     ... and {len(entries) - 8} more songs")
             
             # Check for quality indicators
-            unique_songs = set(song['song_name'] for song in entries)
+            unique_songs = {song['song_name'] for song in entries}
             if len(unique_songs) < len(entries) * 0.8:  # Less than 80% unique
                 print("   ⚠️  Warning: Many duplicate song names detected")
             
             # Check for obvious non-songs
-            non_songs = [song for song in entries if any(word in song['song_name'].lower() 
-                        for word in ['home', 'login', 'copyright', 'powered by', 'built in'])]
+            non_songs = [song for song in entries if _NON_SONG_RE.search(song['song_name'].lower())]
             if non_songs:
                 print(f"   ⚠️  Warning: {len(non_songs)} potential non-song entries detected")
             
             # Check for reasonable song distribution
-            sets = {}
-            for song in entries:
-                set_type = song['set_type']
-                sets[set_type] = sets.get(set_type, 0) + 1
+            sets = Counter(song['set_type'] for song in entries)
             
             print(f"   📊 Set distribution: {dict(sets)}")
             
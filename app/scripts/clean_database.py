@@ -4,39 +4,42 @@ Clean Database Script
 Clears all data from Show, SetlistEntry, Prediction, and PredictedSetlistEntry tables
 """
 
-import subprocess
 import requests
 import sys
 import json
+import tomllib
+from functools import lru_cache
+from pathlib import Path
+
+import clickhouse_connect
+
+TABLES = ["Show", "SetlistEntry", "Prediction", "PredictedSetlistEntry", "PredictionMetadata"]
+
+MOOSE_CONFIG_PATH = Path(__file__).resolve().parents[2] / "moose.config.toml"
+
+@lru_cache(maxsize=1)
+def get_clickhouse_config() -> dict:
+    """Read the [clickhouse_config] section of the project's moose.config.toml"""
+    with open(MOOSE_CONFIG_PATH, "rb") as f:
+        return tomllib.load(f)["clickhouse_config"]
+
+@lru_cache(maxsize=1)
+def get_clickhouse_client():
+    """Open one ClickHouse client connection, reused for every query in this run"""
+    config = get_clickhouse_config()
+    return clickhouse_connect.get_client(
+        host=config["host"],
+        port=config["host_port"],
+        username=config["user"],
+        password=config["password"],
+        database=config["db_name"],
+        secure=config.get("use_ssl", False),
+    )
 
 def execute_clickhouse_query(query: str) -> bool:
-    """Execute a query in ClickHouse via docker"""
+    """Execute a statement over the shared ClickHouse connection"""
     try:
-        # Find the ClickHouse container
-        result = subprocess.run(
-            ["docker", "ps", "--filter", "name=clickhouse", "--format", "{{.Names}}"],
-            capture_output=True,
-            text=True
-        )
-        container_name = result.stdout.strip().split('\n')[0] if result.stdout.strip() else None
-        
-        if not container_name:
-            print("❌ ClickHouse container not found")
-            return False
-        
-        # Execute the query
-        cmd = [
-            "docker", "exec", "-i", container_name,
-            "clickhouse-client",
-            "--query", query
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print(f"❌ Query failed: {result.stderr}")
-            return False
-        
+        get_clickhouse_client().command(query)
         return True
         
     except Exception as e:
@@ -44,35 +47,23 @@ def execute_clickhouse_query(query: str) -> bool:
         return False
 
 def get_table_counts() -> dict:
-    """Get row counts for all tables"""
-    counts = {}
-    tables = ["Show", "SetlistEntry", "Prediction", "PredictedSetlistEntry", "PredictionMetadata"]
+    """Get row counts for all tables from ClickHouse table metadata"""
+    counts = {table: -1 for table in TABLES}
+    
+    # system.tables keeps total_rows for MergeTree tables, so no table scans
+    try:
+        result = get_clickhouse_client().query(
+            "SELECT name, total_rows FROM system.tables "
+            "WHERE database = {database:String} AND name IN {tables:Array(String)}",
+            parameters={"database": get_clickhouse_config()["db_name"], "tables": TABLES},
+        )
+    except Exception as e:
+        print(f"❌ Error counting rows: {e}")
+        return counts
     
-    for table in tables:
-        query = f"SELECT COUNT(*) FROM local.{table}"
-        try:
-            result = subprocess.run(
-                ["docker", "ps", "--filter", "name=clickhouse", "--format", "{{.Names}}"],
-                capture_output=True,
-                text=True
-            )
-            container_name = result.stdout.strip().split('\n')[0] if result.stdout.strip() else None
-            
-            if container_name:
-                cmd = [
-                    "docker", "exec", "-i", container_name,
-                    "clickhouse-client",
-                    "--query", query
-                ]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    counts[table] = int(result.stdout.strip())
-                else:
-                    counts[table] = -1
-            else:
-                counts[table] = -1
-        except:
-            counts[table] = -1
+    for table, total_rows in result.result_rows:
+        if total_rows is not None:
+            counts[table] = int(total_rows)
     
     return counts
 
@@ -99,13 +90,13 @@ def clean_database():
         print("❌ Cleanup cancelled")
         return False
     
-    # Clean each table
+    # Clean each table over the shared connection; a failure is reported
+    # against its table and the remaining tables are still truncated
     print("\n🗑️  Cleaning tables...")
-    tables = ["Show", "SetlistEntry", "Prediction", "PredictedSetlistEntry", "PredictionMetadata"]
-    
-    for table in tables:
+    database = get_clickhouse_config()["db_name"]
+    for table in TABLES:
         print(f"   Truncating {table}...", end=" ")
-        if execute_clickhouse_query(f"TRUNCATE TABLE local.{table}"):
+        if execute_clickhouse_query(f"TRUNCATE TABLE {database}.{table}"):
             print("✅")
         else:
             print("❌")
@@ -6,16 +6,26 @@ Compares predicted setlists with actual setlists to measure accuracy.
 
 import json
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from clickhouse_driver import Client
 
+# Setlist rows are streamed block by block instead of buffered as one list
+STREAM_SETTINGS = {'max_block_size': 10000}
 
-def get_predictions_for_date(client: Client, band_name: str, show_date: str) -> Dict[str, Any]:
+
+def get_setlists_for_dates(client: Client, band_name: str, show_dates: List[str]) -> Dict[str, Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
     """
-    Get all predictions for a specific band and date.
+    Get the predictions and the actual setlists for several shows in one query.
+    
+    Returns:
+        {show_date: (predictions, actual)} for every requested date, where
+        predictions is {algorithm: {'show_id', 'generated_at', 'songs'}} and
+        actual is the list of played songs in set order
     """
     query = """
     SELECT 
+        s.show_date,
+        s.is_prediction,
         s.primary_key as show_id,
         s.prediction_algorithm,
         s.prediction_generated_at,
@@ -25,95 +35,71 @@ def get_predictions_for_date(client: Client, band_name: str, show_date: str) ->
         se.prediction_confidence,
         se.prediction_reasoning,
         se.is_cover,
-        se.original_artist
-    FROM Show s
-    JOIN SetlistEntry se ON se.show_id = s.primary_key
-    WHERE s.band_name = %(band_name)s
-      AND s.show_date = %(show_date)s
-      AND s.is_prediction = true
-    ORDER BY se.set_type, se.set_position
-    """
-    
-    results = client.execute(
-        query,
-        {'band_name': band_name, 'show_date': show_date}
-    )
-    
-    if not results:
-        return {}
-    
-    # Group by algorithm
-    predictions = {}
-    for row in results:
-        algorithm = row[1] or 'unknown'
-        if algorithm not in predictions:
-            predictions[algorithm] = {
-                'show_id': row[0],
-                'generated_at': row[2],
-                'songs': []
-            }
-        
-        predictions[algorithm]['songs'].append({
-            'song_name': row[3],
-            'set_type': row[4],
-            'set_position': row[5],
-            'confidence': row[6],
-            'reasoning': row[7],
-            'is_cover': row[8],
-            'original_artist': row[9]
-        })
-    
-    return predictions
-
-
-def get_actual_setlist(client: Client, band_name: str, show_date: str) -> List[Dict[str, Any]]:
-    """
-    Get the actual setlist for a specific show.
-    """
-    query = """
-    SELECT 
-        se.song_name,
-        se.set_type,
-        se.set_position,
+        se.original_artist,
         se.is_jam,
         se.is_tease,
         se.is_partial,
-        se.is_cover,
-        se.original_artist,
-        se.song_duration_minutes
+        se.song_duration_minutes,
+        lowerUTF8(se.song_name) as song_name_lc
     FROM Show s
     JOIN SetlistEntry se ON se.show_id = s.primary_key
     WHERE s.band_name = %(band_name)s
-      AND s.show_date = %(show_date)s
-      AND s.is_prediction = false
-    ORDER BY se.set_type, se.set_position
+      AND s.show_date IN %(show_dates)s
+    ORDER BY s.show_date, se.set_type, se.set_position
     """
     
-    results = client.execute(
+    results = client.execute_iter(
         query,
-        {'band_name': band_name, 'show_date': show_date}
+        {'band_name': band_name, 'show_dates': tuple(show_dates)},
+        settings=STREAM_SETTINGS
     )
     
-    songs = []
+    setlists = {show_date: ({}, []) for show_date in show_dates}
     for row in results:
-        songs.append({
-            'song_name': row[0],
-            'set_type': row[1],
-            'set_position': row[2],
-            'is_jam': row[3],
-            'is_tease': row[4],
-            'is_partial': row[5],
-            'is_cover': row[6],
-            'original_artist': row[7],
-            'duration_minutes': row[8]
-        })
+        predictions, actual = setlists.setdefault(str(row[0]), ({}, []))
+        if row[1]:
+            # Group predictions by algorithm
+            algorithm = row[3] or 'unknown'
+            if algorithm not in predictions:
+                predictions[algorithm] = {
+                    'show_id': row[2],
+                    'generated_at': row[4],
+                    'songs': []
+                }
+            
+            predictions[algorithm]['songs'].append({
+                'song_name': row[5],
+                'set_type': row[6],
+                'set_position': row[7],
+                'confidence': row[8],
+                'reasoning': row[9],
+                'is_cover': row[10],
+                'original_artist': row[11],
+                'song_name_lc': row[16]
+            })
+        else:
+            actual.append({
+                'song_name': row[5],
+                'set_type': row[6],
+                'set_position': row[7],
+                'is_jam': row[12],
+                'is_tease': row[13],
+                'is_partial': row[14],
+                'is_cover': row[10],
+                'original_artist': row[11],
+                'duration_minutes': row[15],
+                'song_name_lc': row[16]
+            })
     
-    return songs
+    return setlists
 
 
 def calculate_accuracy(predictions: List[Dict], actual: List[Dict]) -> Dict[str, Any]:
     """
     Calculate accuracy metrics for predictions.
+    
+    Songs are matched case-insensitively on their song_name_lc field, which the
+    setlist queries compute in ClickHouse.
     """
     if not predictions or not actual:
         return {
@@ -124,51 +110,61 @@ def calculate_accuracy(predictions: List[Dict], actual: List[Dict]) -> Dict[str,
             'details': []
         }
     
-    # Extract song names
-    predicted_songs = {p['song_name'].lower() for p in predictions}
-    actual_songs = {a['song_name'].lower() for a in actual}
-    
-    # Calculate basic accuracy
-    correct_songs = predicted_songs.intersection(actual_songs)
-    accuracy = len(correct_songs) / len(predicted_songs) if predicted_songs else 0
+    # One pass over the actual setlist: name index, opener and encores.
+    # Song names arrive lowercased from ClickHouse as song_name_lc.
+    actual_by_name = {}
+    actual_opener = None
+    actual_encore_songs = set()
+    for a in actual:
+        name = a['song_name_lc']
+        actual_by_name.setdefault(name, a)  # first occurrence wins
+        if a['set_type'] == 'Encore':
+            actual_encore_songs.add(name)
+        elif actual_opener is None and a['set_position'] == 1 and a['set_type'] == 'Set 1':
+            actual_opener = a
     
-    # Check position accuracy for correct songs
+    # One pass over the predictions: names, opener, encores and position matches
+    predicted_songs = set()
+    predicted_opener = None
+    predicted_encore_songs = set()
     position_accuracy = []
     for pred in predictions:
-        if pred['song_name'].lower() in correct_songs:
-            # Find actual position
-            actual_match = next(
-                (a for a in actual if a['song_name'].lower() == pred['song_name'].lower()),
-                None
-            )
-            if actual_match:
-                position_accuracy.append({
-                    'song': pred['song_name'],
-                    'predicted_set': pred['set_type'],
-                    'actual_set': actual_match['set_type'],
-                    'predicted_position': pred['set_position'],
-                    'actual_position': actual_match['set_position'],
-                    'set_match': pred['set_type'] == actual_match['set_type'],
-                    'confidence': pred.get('confidence', 0)
-                })
+        name = pred['song_name_lc']
+        predicted_songs.add(name)
+        if pred['set_type'] == 'Encore':
+            predicted_encore_songs.add(name)
+        elif predicted_opener is None and pred['set_position'] == 1 and pred['set_type'] == 'Set 1':
+            predicted_opener = pred
+        
+        # Find actual position
+        actual_match = actual_by_name.get(name)
+        if actual_match:
+            position_accuracy.append({
+                'song': pred['song_name'],
+                'predicted_set': pred['set_type'],
+                'actual_set': actual_match['set_type'],
+                'predicted_position': pred['set_position'],
+                'actual_position': actual_match['set_position'],
+                'set_match': pred['set_type'] == actual_match['set_type'],
+                'confidence': pred.get('confidence', 0)
+            })
+    
+    # Calculate basic accuracy
+    actual_songs = set(actual_by_name)
+    correct_songs = predicted_songs & actual_songs
+    accuracy = len(correct_songs) / len(predicted_songs) if predicted_songs else 0
     
     # Calculate opener accuracy
-    predicted_opener = next((p for p in predictions if p['set_position'] == 1 and p['set_type'] == 'Set 1'), None)
-    actual_opener = next((a for a in actual if a['set_position'] == 1 and a['set_type'] == 'Set 1'), None)
     opener_correct = (
         predicted_opener and actual_opener and 
-        predicted_opener['song_name'].lower() == actual_opener['song_name'].lower()
+        predicted_opener['song_name_lc'] == actual_opener['song_name_lc']
     )
     
     # Calculate encore accuracy
-    predicted_encores = [p for p in predictions if p['set_type'] == 'Encore']
-    actual_encores = [a for a in actual if a['set_type'] == 'Encore']
     encore_accuracy = 0
-    if predicted_encores and actual_encores:
-        predicted_encore_songs = {p['song_name'].lower() for p in predicted_encores}
-        actual_encore_songs = {a['song_name'].lower() for a in actual_encores}
-        encore_correct = predicted_encore_songs.intersection(actual_encore_songs)
-        encore_accuracy = len(encore_correct) / len(predicted_encore_songs) if predicted_encore_songs else 0
+    if predicted_encore_songs and actual_encore_songs:
+        encore_correct = predicted_encore_songs & actual_encore_songs
+        encore_accuracy = len(encore_correct) / len(predicted_encore_songs)
     
     return {
         'overall_accuracy': accuracy,
@@ -184,16 +180,10 @@ def calculate_accuracy(predictions: List[Dict], actual: List[Dict]) -> Dict[str,
     }
 
 
-def evaluate_show(client: Client, band_name: str, show_date: str) -> Dict[str, Any]:
+def evaluate_setlists(band_name: str, show_date: str, predictions: Dict[str, Any], actual: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
-    Evaluate all predictions for a specific show.
+    Evaluate a show's predictions against its actual setlist.
     """
-    # Get predictions
-    predictions = get_predictions_for_date(client, band_name, show_date)
-    
-    # Get actual setlist
-    actual = get_actual_setlist(client, band_name, show_date)
-    
     if not predictions:
         return {
             'show_date': show_date,
@@ -229,6 +219,24 @@ def evaluate_show(client: Client, band_name: str, show_date: str) -> Dict[str, A
     }
 
 
+def evaluate_shows(client: Client, band_name: str, show_dates: List[str]) -> List[Dict[str, Any]]:
+    """
+    Evaluate all predictions for several shows with a single query.
+    """
+    setlists = get_setlists_for_dates(client, band_name, show_dates)
+    return [
+        evaluate_setlists(band_name, show_date, *setlists[show_date])
+        for show_date in show_dates
+    ]
+
+
+def evaluate_show(client: Client, band_name: str, show_date: str) -> Dict[str, Any]:
+    """
+    Evaluate all predictions for a specific show.
+    """
+    return evaluate_shows(client, band_name, [show_date])[0]
+
+
 def main():
     """
     Evaluate predictions for recent shows.
@@ -5,12 +5,49 @@ Processes JSON files from El Goose scraper and ingests into Moose
 Uses the Show -> SetlistEntry transform to process embedded entries
 """
 
-import requests
-import json
+import logging
+import orjson
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from moose_http import build_session, post_json
+
+
+logger = logging.getLogger(__name__)
+
+# Shows sent per POST; the ingest endpoint accepts a JSON array of records
+INGEST_BATCH_SIZE = 100
+# Batches posted concurrently (requests are I/O bound and share the session pool)
+INGEST_WORKERS = 8
+
+# Shared by every worker thread, so the pool is sized to match
+_session = build_session(pool_maxsize=INGEST_WORKERS)
+
+
+# Show fields accepted by the Show ingest model (setlist_entries is added separately)
+_SHOW_FIELDS = (
+    'band_name', 'show_date', 'venue_name', 'venue_city', 'venue_state', 'venue_country',
+    'tour_name', 'show_notes', 'verified', 'source_url', 'created_at',
+)
+
+# Fields embedded for each setlist entry, with the defaults used when missing
+_ENTRY_DEFAULTS = {
+    'set_type': 'Set 1',
+    'set_position': 1,
+    'song_name': '',
+    'song_duration_minutes': None,
+    'transitions_into': None,
+    'transitions_from': None,
+    'is_jam': False,
+    'is_tease': False,
+    'is_partial': False,
+    'is_cover': False,
+    'original_artist': None,
+    'performance_notes': None,
+    'guest_musicians': [],
+}
 
 
 def load_scraped_data(filepath: str) -> Dict[str, Any]:
@@ -18,8 +55,8 @@ def load_scraped_data(filepath: str) -> Dict[str, Any]:
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Scraped data file not found: {filepath}")
     
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        data = orjson.loads(f.read())
     
     print(f"📁 Loaded data from {filepath}")
     print(f"📊 Contains {data.get('total_shows', 0)} shows")
@@ -28,41 +65,28 @@ def load_scraped_data(filepath: str) -> Dict[str, Any]:
     return data
 
 
-def prepare_show_for_ingestion(show_data: Dict[str, Any], setlist_entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+def prepare_show_for_ingestion(show_data: Dict[str, Any], setlist_entries: List[Dict[str, Any]],
+                               created_at: Optional[str] = None) -> Dict[str, Any]:
     """
-    Prepare show data for ingestion with embedded setlist entries as JSON string
+    Prepare show data for ingestion with embedded setlist entries as JSON string.
+    created_at is used for shows that don't carry one; bulk callers pass a
+    single timestamp for the whole run.
     """
-    # Remove fields that don't exist in our new schema
-    show = show_data.copy()
-    show.pop('primary_key', None)  # We don't use primary keys anymore
-    show.pop('is_prediction', None)  # This field doesn't exist in Show model
-    
-    # Prepare setlist entries for embedding (remove primary_key and show_id)
-    cleaned_entries = []
-    for entry in setlist_entries:
-        cleaned_entry = {
-            'set_type': entry.get('set_type', 'Set 1'),
-            'set_position': entry.get('set_position', 1),
-            'song_name': entry.get('song_name', ''),
-            'song_duration_minutes': entry.get('song_duration_minutes'),
-            'transitions_into': entry.get('transitions_into'),
-            'transitions_from': entry.get('transitions_from'),
-            'is_jam': entry.get('is_jam', False),
-            'is_tease': entry.get('is_tease', False),
-            'is_partial': entry.get('is_partial', False),
-            'is_cover': entry.get('is_cover', False),
-            'original_artist': entry.get('original_artist'),
-            'performance_notes': entry.get('performance_notes'),
-            'guest_musicians': entry.get('guest_musicians', [])
-        }
-        cleaned_entries.append(cleaned_entry)
+    # Keep only fields that exist in the Show model (drops primary_key, is_prediction, ...)
+    show = {key: show_data[key] for key in _SHOW_FIELDS if key in show_data}
+    
+    # Prepare setlist entries for embedding (only the fields the transform reads)
+    cleaned_entries = [
+        {key: entry.get(key, default) for key, default in _ENTRY_DEFAULTS.items()}
+        for entry in setlist_entries
+    ]
     
     # Add setlist entries as JSON string (our transform expects this)
-    show['setlist_entries'] = json.dumps(cleaned_entries)
+    show['setlist_entries'] = orjson.dumps(cleaned_entries).decode()
     
     # Ensure created_at is present
     if 'created_at' not in show:
-        show['created_at'] = datetime.now().isoformat()
+        show['created_at'] = created_at or datetime.now().isoformat()
     
     return show
 
@@ -73,25 +97,70 @@ def ingest_show_with_entries(show_data: Dict[str, Any], base_url: str = "http://
     The Show -> SetlistEntry transform will automatically create individual entries
     """
     try:
-        response = requests.post(
-            f"{base_url}/ingest/Show", 
-            json=show_data,
-            headers={'Content-Type': 'application/json'}
-        )
+        response = post_json(_session, f"{base_url}/ingest/Show", show_data)
         
         if response.status_code == 200 or response.text.strip() == 'SUCCESS':
-            venue_info = f"{show_data.get('venue_city', '')}, {show_data.get('venue_state', '')}"
-            entry_count = len(json.loads(show_data.get('setlist_entries', '[]')))
-            print(f"✅ Show: {show_data['band_name']} - {show_data['show_date']} at {show_data['venue_name']} ({venue_info}) - {entry_count} songs")
+            if logger.isEnabledFor(logging.DEBUG):
+                venue_info = f"{show_data.get('venue_city', '')}, {show_data.get('venue_state', '')}"
+                entry_count = len(orjson.loads(show_data.get('setlist_entries', '[]')))
+                logger.debug("✅ Show: %s - %s at %s (%s) - %d songs", show_data['band_name'], show_data['show_date'],
+                             show_data['venue_name'], venue_info, entry_count)
             return True
         else:
-            print(f"❌ Failed to ingest show {show_data['show_date']}: {response.status_code} - {response.text[:200]}")
+            logger.warning("❌ Failed to ingest show %s: %s - %s", show_data['show_date'], response.status_code, response.text[:200])
             return False
     except Exception as e:
-        print(f"❌ Error ingesting show {show_data.get('show_date', 'unknown')}: {e}")
+        logger.warning("❌ Error ingesting show %s: %s", show_data.get('show_date', 'unknown'), e)
+        return False
+
+
+def ingest_shows_bulk(shows: List[Dict[str, Any]], base_url: str = "http://localhost:4000") -> bool:
+    """
+    Ingest a batch of shows (with embedded setlist entries) in a single request
+    """
+    try:
+        response = post_json(_session, f"{base_url}/ingest/Show", shows)
+        
+        if response.status_code == 200 or response.text.strip() == 'SUCCESS':
+            return True
+        logger.warning("⚠️  Batch of %d shows rejected: %s - %s", len(shows), response.status_code, response.text[:200])
+        return False
+    except Exception as e:
+        logger.warning("⚠️  Error ingesting batch of %d shows: %s", len(shows), e)
         return False
 
 
+def ingest_batch(batch: List[Dict[str, Any]], start: int, base_url: str = "http://localhost:4000",
+                 created_at: Optional[str] = None) -> Tuple[int, int, int]:
+    """
+    Prepare and ingest one batch of scraped setlists.
+    
+    Returns:
+        (shows ingested, shows failed, songs ingested)
+    """
+    # Prepare shows with embedded entries
+    prepared_shows = [
+        prepare_show_for_ingestion(setlist_data.get('show', {}), setlist_data.get('setlist_entries', []), created_at)
+        for setlist_data in batch
+    ]
+    
+    # Ingest the batch (transform will handle creating SetlistEntry records)
+    if ingest_shows_bulk(prepared_shows, base_url):
+        batch_songs = sum(len(setlist_data.get('setlist_entries', [])) for setlist_data in batch)
+        logger.debug("✅ Shows %d-%d: %d shows with %d songs", start + 1, start + len(batch), len(batch), batch_songs)
+        return len(batch), 0, batch_songs
+    
+    # Retry one show at a time so a bad record only fails itself
+    success_count = failed_count = total_songs = 0
+    for setlist_data, prepared_show in zip(batch, prepared_shows):
+        if ingest_show_with_entries(prepared_show, base_url):
+            success_count += 1
+            total_songs += len(setlist_data.get('setlist_entries', []))
+        else:
+            failed_count += 1
+    return success_count, failed_count, total_songs
+
+
 def ingest_all_shows(data: Dict[str, Any], base_url: str = "http://localhost:4000", limit: int = None) -> None:
     """Ingest all shows from scraped data"""
     
@@ -108,23 +177,26 @@ def ingest_all_shows(data: Dict[str, Any], base_url: str = "http://localhost:400
     failed_count = 0
     total_songs = 0
     
-    for i, setlist_data in enumerate(setlists, 1):
-        show = setlist_data.get('show', {})
-        entries = setlist_data.get('setlist_entries', [])
-        
-        # Prepare show with embedded entries
-        prepared_show = prepare_show_for_ingestion(show, entries)
-        
-        # Ingest the show (transform will handle creating SetlistEntry records)
-        if ingest_show_with_entries(prepared_show, base_url):
-            success_count += 1
-            total_songs += len(entries)
-        else:
-            failed_count += 1
+    # One fallback created_at for every show in this run
+    created_at = datetime.now().isoformat()
+    
+    # Batches are independent, so keep several requests in flight at once
+    with ThreadPoolExecutor(max_workers=INGEST_WORKERS) as executor:
+        futures = [
+            executor.submit(ingest_batch, setlists[start:start + INGEST_BATCH_SIZE], start, base_url, created_at)
+            for start in range(0, len(setlists), INGEST_BATCH_SIZE)
+        ]
         
-        # Progress indicator
-        if i % 10 == 0:
-            print(f"📊 Progress: {i}/{len(setlists)} shows processed...")
+        processed = 0
+        for future in as_completed(futures):
+            batch_success, batch_failed, batch_songs = future.result()
+            success_count += batch_success
+            failed_count += batch_failed
+            total_songs += batch_songs
+            
+            # Progress indicator
+            processed += batch_success + batch_failed
+            logger.info("📊 Progress: %d/%d shows processed...", processed, len(setlists))
     
     print("\n" + "=" * 50)
     print("📊 INGESTION SUMMARY")
@@ -140,7 +212,7 @@ def verify_ingestion(base_url: str = "http://localhost:4000") -> None:
     
     try:
         # Check shows
-        response = requests.get(f"{base_url}/consumption/shows?band_name=Goose&limit=5")
+        response = _session.get(f"{base_url}/consumption/shows?band_name=Goose&limit=5")
         if response.status_code == 200:
             shows = response.json().get('shows', [])
             print(f"✅ Found {len(shows)} shows in database")
@@ -151,7 +223,7 @@ def verify_ingestion(base_url: str = "http://localhost:4000") -> None:
                     print(f"   - {show['show_date']}: {show['venue_name']}")
         
         # Check setlist entries via API
-        response = requests.get(f"{base_url}/consumption/setlists?band_name=Goose&limit=10")
+        response = _session.get(f"{base_url}/consumption/setlists?band_name=Goose&limit=10")
         if response.status_code == 200:
             entries = response.json().get('items', [])
             print(f"\n✅ Found setlist entries in database")
@@ -168,12 +240,15 @@ def verify_ingestion(base_url: str = "http://localhost:4000") -> None:
 def main():
     """Main ingestion function"""
     
+    # Per-show lines are DEBUG; set LOG_LEVEL=DEBUG to see them
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(), format="%(message)s", stream=sys.stdout)
+    
     print("🎸 GOOSE SETLIST DATA INGESTION")
     print("=" * 50)
     
     # Check if Moose is running
     try:
-        response = requests.get("http://localhost:4000/health", timeout=2)
+        response = _session.get("http://localhost:4000/health", timeout=2)
         if response.status_code != 200:
             print("❌ Moose dev server not running on localhost:4000")
             print("💡 Start it with: moose dev")
@@ -5,11 +5,25 @@ Processes JSON files from El Goose scraper and ingests into Moose using the unif
 Only posts to the Show endpoint - SetlistEntry records are created via transform.
 """
 
-import requests
-import json
+import logging
+import orjson
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict, Any
+from moose_http import build_session, post_json
+
+
+logger = logging.getLogger(__name__)
+
+# Shows posted concurrently (requests are I/O bound and share the session pool)
+INGEST_WORKERS = 16
+# Completed shows between progress lines
+PROGRESS_EVERY = 100
+
+# Shared by every worker thread, so the pool is sized to match
+_session = build_session(pool_maxsize=INGEST_WORKERS)
 
 
 def load_scraped_data(filepath: str) -> Dict[str, Any]:
@@ -17,8 +31,8 @@ def load_scraped_data(filepath: str) -> Dict[str, Any]:
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Scraped data file not found: {filepath}")
     
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        data = orjson.loads(f.read())
     
     print(f"📁 Loaded data from {filepath}")
     print(f"📊 Contains {data.get('total_shows', 0)} shows")
@@ -31,6 +45,9 @@ def create_unified_show(show_data: Dict[str, Any], entries: List[Dict[str, Any]]
     """
     Create a unified Show record with embedded setlist entries.
     
+    The show dict is updated in place (callers pass freshly loaded scrape data
+    they don't reuse), so no per-show copy is made.
+    
     Args:
         show_data: The show metadata
         entries: List of setlist entries
@@ -38,13 +55,8 @@ def create_unified_show(show_data: Dict[str, Any], entries: List[Dict[str, Any]]
     Returns:
         Unified Show record with embedded entries
     """
-    # Create the unified show record
-    unified_show = {
-        **show_data,  # Include all existing show fields
-        'setlist_entries': entries  # Add embedded entries
-    }
-    
-    return unified_show
+    show_data['setlist_entries'] = entries  # Add embedded entries
+    return show_data
 
 
 def ingest_unified_show(unified_show: Dict[str, Any], base_url: str = "http://localhost:4000") -> bool:
@@ -53,17 +65,17 @@ def ingest_unified_show(unified_show: Dict[str, Any], base_url: str = "http://lo
     The SetlistEntry records will be created automatically via transform.
     """
     try:
-        response = requests.post(f"{base_url}/ingest/Show", json=unified_show)
+        response = post_json(_session, f"{base_url}/ingest/Show", unified_show)
         if response.status_code == 200:
             show_info = f"{unified_show['band_name']} - {unified_show['show_date']} at {unified_show['venue_name']}"
             num_songs = len(unified_show.get('setlist_entries', []))
-            print(f"✅ Show: {show_info} ({num_songs} songs)")
+            logger.debug("✅ Show: %s (%d songs)", show_info, num_songs)
             return True
         else:
-            print(f"❌ Failed to ingest show {unified_show['show_date']}: {response.status_code} - {response.text}")
+            logger.warning("❌ Failed to ingest show %s: %s - %s", unified_show['show_date'], response.status_code, response.text)
             return False
     except Exception as e:
-        print(f"❌ Error ingesting show {unified_show.get('show_date', 'unknown')}: {e}")
+        logger.warning("❌ Error ingesting show %s: %s", unified_show.get('show_date', 'unknown'), e)
         return False
 
 
@@ -89,33 +101,47 @@ def ingest_all_scraped_data(filepath: str, base_url: str = "http://localhost:400
     total_shows_success = 0
     total_songs = 0
     
+    # Create unified shows with embedded entries
+    unified_shows = []
     for i, setlist in enumerate(setlists, 1):
-        print(f"\n📅 Processing show {i}/{len(setlists)}")
-        
         # Get show data and entries
         show_data = setlist.get('show')
         entries = setlist.get('setlist_entries', [])
         
         if not show_data:
-            print("   ⚠️ No show data found, skipping...")
+            print(f"   ⚠️ Show {i}/{len(setlists)}: no show data found, skipping...")
             continue
         
-        # Create unified show with embedded entries
-        unified_show = create_unified_show(show_data, entries)
-        
-        # Ingest the unified show
-        if ingest_unified_show(unified_show, base_url):
-            total_shows_success += 1
-            total_songs += len(entries)
+        unified_shows.append(create_unified_show(show_data, entries))
+    
+    # Ingest the unified shows; each POST is independent, so keep several in flight
+    with ThreadPoolExecutor(max_workers=INGEST_WORKERS) as executor:
+        futures = {
+            executor.submit(ingest_unified_show, unified_show, base_url): unified_show
+            for unified_show in unified_shows
+        }
         
-        # Display song details
-        if entries:
-            print(f"   🎵 Songs included:")
-            for entry in entries[:5]:  # Show first 5 songs
-                set_indicator = "🔥" if entry.get('is_jam') else "🎵"
-                print(f"      {set_indicator} {entry['song_name']} ({entry['set_type']} #{entry['set_position']})")
-            if len(entries) > 5:
-                print(f"      ... and {len(entries) - 5} more songs")
+        for processed, future in enumerate(as_completed(futures), 1):
+            unified_show = futures[future]
+            entries = unified_show['setlist_entries']
+            ingested = future.result()
+            if ingested:
+                total_shows_success += 1
+                total_songs += len(entries)
+            
+            # One summary line per PROGRESS_EVERY shows instead of per-show output
+            if processed % PROGRESS_EVERY == 0:
+                logger.info("📊 Progress: %d/%d shows processed (%d successful)", processed, len(futures), total_shows_success)
+            
+            # Display song details (one log call so concurrent output doesn't interleave)
+            if ingested and entries and logger.isEnabledFor(logging.DEBUG):
+                lines = [f"   🎵 Songs included ({unified_show['show_date']}):"]
+                for entry in entries[:5]:  # Show first 5 songs
+                    set_indicator = "🔥" if entry.get('is_jam') else "🎵"
+                    lines.append(f"      {set_indicator} {entry['song_name']} ({entry['set_type']} #{entry['set_position']})")
+                if len(entries) > 5:
+                    lines.append(f"      ... and {len(entries) - 5} more songs")
+                logger.debug("%s", "\n".join(lines))
     
     # Summary
     print("\n" + "=" * 50)
@@ -146,6 +172,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Per-show lines are DEBUG; set LOG_LEVEL=DEBUG to see them
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(), format="%(message)s", stream=sys.stdout)
+    
     # Run the ingestion
     ingest_all_scraped_data(args.file, args.url)
 
@@ -3,15 +3,51 @@
 
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from requests_cache import CachedSession
 import re
 from urllib.parse import urljoin
 
+# Shares the scraper's on-disk cache so repeated inspections don't re-download pages;
+# the session also keeps connections to elgoose.net alive between requests
+SESSION = CachedSession('data/elgoose_cache', backend='sqlite', expire_after=3600, allowable_codes=(200, 404))
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+})
+PREFETCH_WORKERS = 5
+
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+SETLIST_CLASS_RE = re.compile(r'setlist|songs|tracklist', re.I)
+CONTAINER_TAGS = ['div', 'table', 'ul', 'ol']
+
+# Common setlist patterns
+SONG_PATTERNS = [
+    re.compile(r'Set\s+(\d+|One|Two|I{1,3})[:\s]*(.+?)(?=Set\s+\d+|Encore|$)', re.MULTILINE | re.IGNORECASE),
+    re.compile(r'(Encore)[:\s]*(.+?)(?=Set\s+|$)', re.MULTILINE | re.IGNORECASE),
+    re.compile(r'(\d+\.\s*[A-Za-z\s]+)', re.MULTILINE | re.IGNORECASE),  # Numbered songs
+    re.compile(r'([A-Z][a-z\s]+(?:\s+>))', re.MULTILINE | re.IGNORECASE),  # Song transitions
+]
+
+def contains_date(value):
+    """Check for a YYYY-MM-DD date, skipping the regex when there can't be one"""
+    # A date needs at least two dashes; most hrefs and link texts have fewer
+    return value.count('-') >= 2 and DATE_RE.search(value) is not None
+
+def text_preview(node, limit, strip=False):
+    """Same as node.get_text()[:limit] (stripped first if asked), but stops reading strings once the preview is full"""
+    text = ''
+    for string in node.strings:
+        text += string
+        if len(text.strip() if strip else text) > limit:
+            break
+    return (text.strip() if strip else text)[:limit]
+
 def inspect_main_page():
     """Inspect the main setlists page to find real setlist links"""
     print("🔍 Inspecting https://elgoose.net/setlists/")
     
-    response = requests.get('https://elgoose.net/setlists/')
-    soup = BeautifulSoup(response.content, 'html.parser')
+    response = SESSION.get('https://elgoose.net/setlists/')
+    soup = BeautifulSoup(response.content, 'lxml')
     
     print("\n📋 Looking for real setlist links...")
     setlist_links = []
@@ -22,7 +58,7 @@ def inspect_main_page():
         text = link.get_text().strip()
         
         # Look for date patterns in URL or text
-        if href and (re.search(r'\d{4}-\d{2}-\d{2}', href) or re.search(r'\d{4}-\d{2}-\d{2}', text)):
+        if href and (contains_date(href) or contains_date(text)):
             full_url = urljoin('https://elgoose.net', href)
             print(f"  📅 {full_url}")
             print(f"     Text: {text[:60]}")
@@ -33,49 +69,52 @@ def inspect_main_page():
     
     return setlist_links
 
-def inspect_setlist_page(url):
-    """Inspect a specific setlist page to understand its structure"""
+def fetch_pages(urls):
+    """Download pages concurrently, returning each page's bytes (None if the fetch failed)"""
+    def fetch(url):
+        try:
+            return SESSION.get(url).content
+        except requests.RequestException:
+            return None
+    
+    with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as executor:
+        return list(executor.map(fetch, urls))
+
+def inspect_setlist_page(url, content=None):
+    """Inspect a specific setlist page to understand its structure (content is the prefetched page, if any)"""
     print(f"\n🎵 Inspecting setlist page: {url}")
     
     try:
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if content is None:
+            content = SESSION.get(url).content
+        soup = BeautifulSoup(content, 'lxml')
         
         # Look for common setlist container patterns
         print("\n🔍 Searching for setlist containers...")
         
-        # Check for various container types
-        containers = [
-            soup.find_all('div', class_=re.compile(r'setlist|songs|tracklist', re.I)),
-            soup.find_all('table', class_=re.compile(r'setlist|songs|tracklist', re.I)),
-            soup.find_all('ul', class_=re.compile(r'setlist|songs|tracklist', re.I)),
-            soup.find_all('ol', class_=re.compile(r'setlist|songs|tracklist', re.I)),
-        ]
+        # Check for various container types in a single pass, then group by tag
+        containers = {tag: [] for tag in CONTAINER_TAGS}
+        for container in soup.find_all(CONTAINER_TAGS, class_=SETLIST_CLASS_RE):
+            containers[container.name].append(container)
         
-        for container_type in containers:
+        for container_type in containers.values():
             if container_type:
                 print(f"  ✅ Found {len(container_type)} potential containers")
                 for i, container in enumerate(container_type[:2]):  # Show first 2
                     print(f"     Container {i+1}: {container.name} class='{container.get('class')}'")
-                    content = container.get_text()[:200]
+                    content = text_preview(container, 200)
                     print(f"     Content preview: {content}")
         
-        # Look for specific song patterns
+        # Look for specific song patterns, in the first setlist container when there is one;
+        # the rest of the page is mostly navigation and footer text
         print("\n🎶 Looking for song patterns...")
-        text = soup.get_text()
-        
-        # Common setlist patterns
-        patterns = [
-            r'Set\s+(\d+|One|Two|I{1,3})[:\s]*(.+?)(?=Set\s+\d+|Encore|$)',
-            r'(Encore)[:\s]*(.+?)(?=Set\s+|$)',
-            r'(\d+\.\s*[A-Za-z\s]+)',  # Numbered songs
-            r'([A-Z][a-z\s]+(?:\s+>))',  # Song transitions
-        ]
+        pattern_scope = next((found[0] for found in containers.values() if found), soup)
+        text = pattern_scope.get_text()
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.MULTILINE | re.IGNORECASE)
+        for pattern in SONG_PATTERNS:
+            matches = pattern.findall(text)
             if matches:
-                print(f"  🎯 Pattern '{pattern[:30]}...' found {len(matches)} matches")
+                print(f"  🎯 Pattern '{pattern.pattern[:30]}...' found {len(matches)} matches")
                 for match in matches[:3]:  # Show first 3
                     print(f"     {match}")
         
@@ -89,7 +128,7 @@ def inspect_setlist_page(url):
             if len(items) > 5:  # Likely a setlist if it has many items
                 print(f"  📝 List {i+1}: {len(items)} items")
                 for j, item in enumerate(items[:3]):
-                    print(f"     Item {j+1}: {item.get_text().strip()[:50]}")
+                    print(f"     Item {j+1}: {text_preview(item, 50, strip=True)}")
         
         return soup
         
@@ -108,13 +147,14 @@ def main():
         print("❌ No setlist links found")
         return
     
-    # Inspect the first real setlist page
+    # Inspect the real setlist pages, downloading them all up front
     print(f"\n📊 Found {len(setlist_links)} setlist links")
-    print("🔬 Analyzing first setlist page in detail...")
+    print("🔬 Analyzing setlist pages in detail...")
     
-    soup = inspect_setlist_page(setlist_links[0])
+    pages = fetch_pages(setlist_links)
+    soups = [inspect_setlist_page(url, content) for url, content in zip(setlist_links, pages)]
     
-    if soup:
+    if any(soups):
         print("\n💡 RECOMMENDATIONS FOR SCRAPER:")
         print("1. Target specific HTML containers (div, table, ul, ol) with setlist-related classes")
         print("2. Look for numbered lists or structured song layouts")
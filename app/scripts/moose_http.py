@@ -0,0 +1,44 @@
+"""
+HTTP helpers shared by the ingest scripts and the local Moose API clients
+"""
+
+import gzip
+import os
+from typing import Any
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Set INGEST_GZIP=1 to gzip request bodies (the ingest server must accept
+# Content-Encoding: gzip); off by default
+INGEST_GZIP = os.environ.get("INGEST_GZIP") == "1"
+
+
+def build_session(pool_maxsize: int = 10) -> requests.Session:
+    """
+    Keep-alive session for the local Moose APIs.
+
+    Size pool_maxsize to the number of threads sharing the session. Failed
+    connections are retried for every method, but 502/503/504 responses are
+    only retried for idempotent methods such as GET: urllib3 never replays a
+    POST on a status code, so an ingest request can't write its rows twice.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    return session
+
+
+def post_json(session: requests.Session, url: str, payload: Any) -> requests.Response:
+    """POST a payload encoded with orjson, gzip-compressed when INGEST_GZIP is set"""
+    body = orjson.dumps(payload)
+    headers = {'Content-Type': 'application/json'}
+    if INGEST_GZIP:
+        body = gzip.compress(body, compresslevel=1)
+        headers['Content-Encoding'] = 'gzip'
+    return session.post(url, data=body, headers=headers)
@@ -1,9 +1,14 @@
 # Sample Setlist Data Ingestion
 # This script demonstrates how to structure and ingest setlist data
 
-import requests
+import json
 from datetime import date, datetime
 from typing import List, Dict, Any
+from moose_http import build_session
+from setlist_keys import slug_for_set
+
+
+_session = build_session()
 
 
 def create_sample_goose_show():
@@ -57,10 +62,11 @@ def create_sample_setlist_entries():
     
     entries = []
     for item in setlist:
+        set_slug = slug_for_set(item['set'])
         entry = {
-            "primary_key": f"{show_id}-{item['set'].lower().replace(' ', '')}-{item['pos']}",
+            "primary_key": f"{show_id}-{set_slug}-{item['pos']}",
             "show_id": show_id,
-            "band_name": "Dead Ahead",  # Special project band
+            "band_name": "Goose",  # The transform stamps entries with the show's band
             "show_date": show_date,
             "set_type": item["set"],
             "set_position": item["pos"],
@@ -83,44 +89,34 @@ def create_sample_setlist_entries():
 def ingest_sample_data(base_url: str = "http://localhost:4000"):
     """Ingest sample data via the Moose APIs"""
     
-    # Ingest the show
     show_data = create_sample_goose_show()
-    print(f"Ingesting show: {show_data['band_name']} - {show_data['show_date']}")
+    setlist_entries = create_sample_setlist_entries()
+    
+    # SetlistEntry has no ingest endpoint of its own: the entries ride along in the
+    # Show request and the Show -> SetlistEntry transform fans them out
+    show_data["setlist_entries"] = json.dumps(setlist_entries)
+    print(f"Ingesting show: {show_data['band_name']} - {show_data['show_date']} "
+          f"with {len(setlist_entries)} setlist entries")
     
     try:
-        response = requests.post(f"{base_url}/ingest/Show", json=show_data)
+        response = _session.post(f"{base_url}/ingest/Show", json=show_data)
         if response.status_code == 200:
-            print("✅ Show ingested successfully")
+            print(f"✅ Show ingested with {len(setlist_entries)} embedded setlist entries")
         else:
             print(f"❌ Failed to ingest show: {response.status_code} - {response.text}")
     except Exception as e:
         print(f"❌ Error ingesting show: {e}")
-    
-    # Ingest the setlist entries
-    setlist_entries = create_sample_setlist_entries()
-    print(f"Ingesting {len(setlist_entries)} setlist entries...")
-    
-    success_count = 0
-    for entry in setlist_entries:
-        try:
-            response = requests.post(f"{base_url}/ingest/SetlistEntry", json=entry)
-            if response.status_code == 200:
-                success_count += 1
-                print(f"✅ {entry['song_name']} ({entry['set_type']})")
-            else:
-                print(f"❌ Failed to ingest {entry['song_name']}: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Error ingesting {entry['song_name']}: {e}")
-    
-    print(f"\n🎵 Successfully ingested {success_count}/{len(setlist_entries)} setlist entries")
 
 
 def query_sample_data(base_url: str = "http://localhost:4000"):
     """Query the ingested data to verify it worked"""
     
+    # Setlist entries carry the band of the show they were embedded in
+    band_name = create_sample_goose_show()["band_name"]
+    
     print("\n🔍 Querying song statistics...")
     try:
-        response = requests.get(f"{base_url}/consumption/song-stats?band_name=Dead Ahead&limit=10")
+        response = _session.get(f"{base_url}/consumption/song-stats", params={"band_name": band_name, "limit": 10})
         if response.status_code == 200:
             data = response.json()
             print("📊 Song Statistics:")
@@ -3,20 +3,82 @@
 # Also scrapes individual song pages for detailed performance statistics
 
 import requests
-from bs4 import BeautifulSoup
-import json
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
+from requests_cache import CachedSession
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+import orjson
 import re
 from datetime import datetime, date, UTC
-from typing import List, Dict, Any, Optional, Set
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Any, NamedTuple, Optional, Set
 from urllib.parse import urljoin, quote
 import time
 import os
+from setlist_keys import slug_for_set
+
+# Fetched pages are cached on disk so re-runs don't hit el-goose.net again
+HTTP_CACHE_NAME = 'data/elgoose_cache'
+HTTP_CACHE_EXPIRE_SECONDS = 3600
+
+# Year pages are fetched concurrently, but only a few at a time to stay polite
+YEAR_FETCH_WORKERS = 3
+
+# The covers/originals pages are only read for their tables; skip building the rest of the page
+TABLES_ONLY = SoupStrainer('table')
+
+SET_LABEL_SELECTOR = 'b[class*="setlabel"]'
+
+# Venue name -> show_id slug: spaces to hyphens, drop apostrophes/commas, '&' -> 'and'
+_VENUE_SLUG_TABLE = str.maketrans({' ': '-', "'": None, ',': None, '&': 'and'})
+
+
+class ParsedSong(NamedTuple):
+    """One song as read from a setlist body, before it becomes a setlist entry"""
+    name: str
+    set_name: str
+    position: int
+    notes: Optional[str]
+    performance_description: Optional[str]
+    is_jam_chart: bool
+    is_jam: bool
+    is_tease: bool
+    is_partial: bool
+    duration: Optional[float] = None
+    transitions_into: Optional[str] = None
+    transitions_from: Optional[str] = None
+
+
+@lru_cache(maxsize=512)
+def _slugify_venue(venue_name: str) -> str:
+    """Slug a venue name for show ids; most venues host many shows, so results are cached"""
+    return venue_name.lower().translate(_VENUE_SLUG_TABLE)
+
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+SLUG_INVALID_CHARS_RE = re.compile(r'[^a-z0-9\s\-&]')
+WHITESPACE_RE = re.compile(r'\s+')
+HYPHEN_RUN_RE = re.compile(r'-+')
+TRANSITION_MARKS_RE = re.compile(r'^[>\-<\s]+|[>\-<\s]+$')
+
+# Statistics sentences on a song page ("has been played by Goose 129 times", ...)
+TIMES_PLAYED_RE = re.compile(r'has been played by Goose (\d+) times')
+SHOW_PERCENTAGE_RE = re.compile(r'It was played at ([\d.]+)% of Goose shows')
+LAST_PLAYED_RE = re.compile(r'It was last played ([\d-]+)')
+SHOWS_AGO_RE = re.compile(r'which was (\d+) show\(s\) ago')
+FREQUENCY_RE = re.compile(r'once every (\d+) show\(s\)')
+SHOWS_SINCE_DEBUT_RE = re.compile(r'There have been (\d+) show\(s\) since the live debut')
 
 
 class ElGooseScraper:
     def __init__(self, base_url: str = "https://elgoose.net"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = CachedSession(
+            HTTP_CACHE_NAME,
+            backend='sqlite',
+            expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+            allowable_codes=(200, 404),  # Songs without a page stay missing on re-runs
+        )
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
@@ -25,8 +87,8 @@ class ElGooseScraper:
         self.originals_database = {}  # Cache original songs information from originals page
         self.master_song_database = {}  # Combined song database with all metadata
     
-    def get_setlists_by_year(self, year: int = 2025) -> List[Dict[str, Any]]:
-        """Get all setlists for a specific year from the year-specific page"""
+    def get_setlists_by_year(self, year: int = 2025, start_from_date: Optional[date] = None) -> List[Dict[str, Any]]:
+        """Get all setlists for a specific year from the year-specific page, skipping shows before start_from_date"""
         year_url = f"{self.base_url}/setlists/{year}"
         print(f"🔍 Fetching setlists for year {year} from {year_url}")
         
@@ -34,8 +96,9 @@ class ElGooseScraper:
             response = self.session.get(year_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            return self.parse_setlists_from_html(soup, year_url)
+            tree = LexborHTMLParser(response.content)
+            del response  # Lexbor keeps its own copy; drop the raw bytes before walking the tree
+            return self.parse_setlists_from_html(tree, year_url, start_from_date)
             
         except requests.RequestException as e:
             print(f"❌ Error fetching year {year}: {e}")
@@ -45,41 +108,45 @@ class ElGooseScraper:
         """Scrape setlists from multiple years, optionally starting from a specific date"""
         all_setlists = []
         
-        for year in years:
-            print(f"📅 Processing year {year}...")
-            year_setlists = self.get_setlists_by_year(year)
-            
-            # Filter by start date if specified
-            if start_from_date:
-                year_setlists = [setlist for setlist in year_setlists 
-                               if setlist['show']['show_date'] >= start_from_date]
-            
-            all_setlists.extend(year_setlists)
-            
-            # Be respectful with requests
-            time.sleep(0.5)
+        # Filter by start date if specified: whole years before it aren't fetched at all,
+        # and earlier shows in its year are skipped before their sections are parsed
+        start_date = date.fromisoformat(start_from_date) if start_from_date else None
+        if start_date:
+            years = [year for year in years if year >= start_date.year]
+        
+        print(f"📅 Processing years {', '.join(map(str, years))}...")
+        with ThreadPoolExecutor(max_workers=YEAR_FETCH_WORKERS) as executor:
+            # map keeps results in year order regardless of completion order
+            for year_setlists in executor.map(self.get_setlists_by_year, years, repeat(start_date)):
+                all_setlists.extend(year_setlists)
         
         return all_setlists
     
-    def parse_setlists_from_html(self, soup: BeautifulSoup, source_url: str) -> List[Dict[str, Any]]:
+    def parse_setlists_from_html(self, tree: LexborHTMLParser, source_url: str,
+                                 start_from_date: Optional[date] = None) -> List[Dict[str, Any]]:
         """Parse setlists from the HTML page - data is embedded, not loaded via AJAX"""
         setlists = []
         
         # Find all setlist sections - they have class 'setlist' and id like '2025-06-06'
-        setlist_sections = soup.find_all('section', class_='setlist', id=True)
+        setlist_sections = tree.css('section.setlist[id]')
         print(f"📋 Found {len(setlist_sections)} setlist sections in HTML")
         
         for section in setlist_sections:
-            section_id = section.get('id')
-            print(f"🎯 Processing setlist: {section_id}")
+            section_id = section.attributes.get('id') or ''
             
             # Parse the date from the ID
             try:
-                show_date = datetime.strptime(section_id, '%Y-%m-%d').date()
+                show_date = date.fromisoformat(section_id)
             except ValueError:
                 print(f"⚠️  Invalid date format in section ID: {section_id}")
                 continue
             
+            # Check the date range before descending into the section
+            if start_from_date and show_date < start_from_date:
+                continue
+            
+            print(f"🎯 Processing setlist: {section_id}")
+            
             # Extract setlist data from this section
             setlist_data = self.parse_setlist_section(section, show_date, source_url)
             if setlist_data:
@@ -87,7 +154,7 @@ class ElGooseScraper:
         
         return setlists
 
-    def parse_setlist_section(self, section: BeautifulSoup, show_date: date, url: str) -> Optional[Dict[str, Any]]:
+    def parse_setlist_section(self, section: LexborNode, show_date: date, url: str) -> Optional[Dict[str, Any]]:
         """Parse a single setlist section from the HTML page"""
         
         # Extract venue information from setlist header
@@ -95,24 +162,24 @@ class ElGooseScraper:
         venue_city = None
         venue_state = None
         
-        header = section.find('div', class_='setlist-header')
+        header = section.css_first('div.setlist-header')
         if header:
             # Look for venue links
-            venue_link = header.find('a', class_='venue')
+            venue_link = header.css_first('a.venue')
             if venue_link:
-                venue_name = venue_link.get_text().strip()
+                venue_name = venue_link.text().strip()
             
             # Look for city/state links
-            city_links = header.find_all('a', href=re.compile(r'/venues/city/'))
-            if city_links:
-                venue_city = city_links[0].get_text().strip()
+            city_link = header.css_first('a[href*="/venues/city/"]')
+            if city_link:
+                venue_city = city_link.text().strip()
             
-            state_links = header.find_all('a', href=re.compile(r'/venues/state/'))
-            if state_links:
-                venue_state = state_links[0].get_text().strip()
+            state_link = header.css_first('a[href*="/venues/state/"]')
+            if state_link:
+                venue_state = state_link.text().strip()
         
         # Extract setlist content from setlist-body
-        setlist_body = section.find('div', class_='setlist-body')
+        setlist_body = section.css_first('div.setlist-body')
         if not setlist_body:
             print(f"⚠️  No setlist body found for {show_date}")
             return None
@@ -124,8 +191,11 @@ class ElGooseScraper:
             print(f"⚠️  No songs found for {show_date}")
             return None
         
+        # One timestamp for the show, its entries and the scrape record
+        now_iso = datetime.now(UTC).isoformat()
+        
         # Create show data
-        show_id = f"goose-{show_date}-{venue_name.lower().replace(' ', '-').replace("'", '').replace(',', '').replace('&', 'and')}"
+        show_id = f"goose-{show_date}-{_slugify_venue(venue_name)}"
         
         show_data = {
             "primary_key": show_id,
@@ -139,31 +209,32 @@ class ElGooseScraper:
             "show_notes": f"Retrieved from el-goose.net",
             "verified": True,
             "source_url": url,
-            "created_at": datetime.now(UTC).isoformat()
+            "created_at": now_iso
         }
         
         # Create setlist entries
         setlist_entries = []
         for song in songs:
+            set_slug = slug_for_set(song.set_name)
             entry = {
-                "primary_key": f"{show_id}-{song['set'].lower().replace(' ', '')}-{song['position']}",
+                "primary_key": f"{show_id}-{set_slug}-{song.position}",
                 "show_id": show_id,
                 "band_name": "Goose",
                 "show_date": show_date.isoformat(),
-                "set_type": song["set"],
-                "set_position": song["position"],
-                "song_name": song["name"],
-                "song_duration_minutes": song.get("duration"),
-                "transitions_into": song.get("transitions_into"),
-                "transitions_from": song.get("transitions_from"),
-                "is_jam": song.get("is_jam", False),
-                "is_tease": song.get("is_tease", False),
-                "is_partial": song.get("is_partial", False),
-                "performance_notes": song.get("notes"),
-                "performance_description": song.get("performance_description"),
-                "is_jam_chart": song.get("is_jam_chart", False),
+                "set_type": song.set_name,
+                "set_position": song.position,
+                "song_name": song.name,
+                "song_duration_minutes": song.duration,
+                "transitions_into": song.transitions_into,
+                "transitions_from": song.transitions_from,
+                "is_jam": song.is_jam,
+                "is_tease": song.is_tease,
+                "is_partial": song.is_partial,
+                "performance_notes": song.notes,
+                "performance_description": song.performance_description,
+                "is_jam_chart": song.is_jam_chart,
                 "guest_musicians": [],
-                "created_at": datetime.now(UTC).isoformat()
+                "created_at": now_iso
             }
             setlist_entries.append(entry)
         
@@ -171,35 +242,32 @@ class ElGooseScraper:
             "show": show_data,
             "setlist_entries": setlist_entries,
             "url": url,
-            "scraped_at": datetime.now(UTC).isoformat()
+            "scraped_at": now_iso
         }
     
-    def parse_setlist_body(self, setlist_body: BeautifulSoup) -> List[Dict[str, Any]]:
+    def parse_setlist_body(self, setlist_body: LexborNode) -> List[ParsedSong]:
         """Parse songs from the setlist body HTML"""
         songs = []
         
-        # Find all set labels and their content
-        paragraphs = setlist_body.find_all('p')
+        # Only paragraphs with a set label like <b class='setlabel set-1'>Set 1:</b> hold songs;
+        # the :has() filter runs in Lexbor, so unlabeled paragraphs never reach Python
+        paragraphs = setlist_body.css(f'p:has({SET_LABEL_SELECTOR})')
         
         for paragraph in paragraphs:
-            # Look for set labels like <b class='setlabel set-1'>Set 1:</b>
-            set_label = paragraph.find('b', class_=re.compile(r'setlabel'))
-            if not set_label:
-                continue
-            
-            set_name = set_label.get_text().strip().rstrip(':')
+            set_label = paragraph.css_first(SET_LABEL_SELECTOR)
+            set_name = set_label.text().strip().rstrip(':')
             
             # Find all song boxes in this paragraph
-            song_boxes = paragraph.find_all('span', class_='setlist-songbox')
+            song_boxes = paragraph.css('span.setlist-songbox')
             
             for i, song_box in enumerate(song_boxes, 1):
-                song_link = song_box.find('a')
+                song_link = song_box.css_first('a')
                 if not song_link:
                     continue
                 
                 # Get song name from text content (this should always be the song name)
-                song_name_text = song_link.get_text().strip()
-                title_attr = song_link.get('title', '').strip()
+                song_name_text = song_link.text().strip()
+                title_attr = (song_link.attributes.get('title') or '').strip()
                 
                 # Debug: Check if we have a mismatch between text and title length
                 if title_attr and len(title_attr) > 50 and len(song_name_text) < 30:
@@ -211,7 +279,7 @@ class ElGooseScraper:
                     # Regular song or title is just song name
                     song_name = song_name_text or title_attr
                     performance_description = None
-                    is_jam_chart = 'jamchart' in song_link.get('class', [])
+                    is_jam_chart = 'jamchart' in (song_link.attributes.get('class') or '').split()
                     
                     if is_jam_chart and title_attr and title_attr != song_name:
                         performance_description = title_attr
@@ -226,30 +294,37 @@ class ElGooseScraper:
                     continue
                 
                 # Check for transitions
-                transition_span = song_box.find('span', class_='setlist-transition')
+                transition_span = song_box.css_first('span.setlist-transition')
                 transitions_into = None
                 is_jam = False
                 
                 if transition_span:
-                    transition_text = transition_span.get_text().strip()
+                    transition_text = transition_span.text().strip()
                     if '->' in transition_text or '>' in transition_text:
                         is_jam = True
                         # Could parse the actual transition target here if needed
                 
                 # Check for footnotes (performance notes)
-                footnotes = song_box.find_all('sup')
+                footnotes = song_box.css('sup')
                 notes = []
                 is_tease = False
                 is_partial = False
                 
+                seen_notes = set()
+                
                 for footnote in footnotes:
-                    note_text = footnote.get('title', '')
-                    if note_text:
-                        notes.append(note_text)
-                        if 'tease' in note_text.lower():
-                            is_tease = True
-                        if 'unfinished' in note_text.lower() or 'partial' in note_text.lower():
-                            is_partial = True
+                    note_text = footnote.attributes.get('title') or ''
+                    # Repeated footnotes (e.g. "Without Rick") are kept once
+                    if not note_text or note_text in seen_notes:
+                        continue
+                    seen_notes.add(note_text)
+                    notes.append(note_text)
+                    
+                    note_lower = note_text.lower()
+                    if 'tease' in note_lower:
+                        is_tease = True
+                    if 'unfinished' in note_lower or 'partial' in note_lower:
+                        is_partial = True
                 
                 # Combine footnotes with performance description
                 all_notes = []
@@ -258,22 +333,18 @@ class ElGooseScraper:
                 if notes:
                     all_notes.extend(notes)
                 
-                song_data = {
-                    "name": song_name.strip(),
-                    "set": set_name,
-                    "position": i,
-                    "duration": None,
-                    "notes": '; '.join(all_notes) if all_notes else None,
-                    "performance_description": performance_description,
-                    "is_jam_chart": is_jam_chart,
-                    "transitions_into": transitions_into,
-                    "transitions_from": None,
-                    "is_jam": is_jam,
-                    "is_tease": is_tease,
-                    "is_partial": is_partial
-                }
-                
-                songs.append(song_data)
+                songs.append(ParsedSong(
+                    name=song_name.strip(),
+                    set_name=set_name,
+                    position=i,
+                    notes='; '.join(all_notes) if all_notes else None,
+                    performance_description=performance_description,
+                    is_jam_chart=is_jam_chart,
+                    is_jam=is_jam,
+                    is_tease=is_tease,
+                    is_partial=is_partial,
+                    transitions_into=transitions_into,
+                ))
         
         return songs
     
@@ -349,7 +420,7 @@ class ElGooseScraper:
             response = self.session.get(originals_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=TABLES_ONLY)
             originals_data = self.parse_song_database_page(soup, is_covers=False)
             
             # Cache the results
@@ -559,13 +630,13 @@ class ElGooseScraper:
         os.makedirs("data", exist_ok=True)
         filepath = f"data/{filename}"
         
-        with open(filepath, 'w') as f:
-            json.dump({
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps({
                 "scraped_at": datetime.now(UTC).isoformat(),
                 "total_shows": len(setlists),
                 "source": "el-goose.net year-specific pages",
                 "setlists": setlists
-            }, f, indent=2, default=str)
+            }, option=orjson.OPT_INDENT_2))
         
         print(f"💾 Saved {len(setlists)} setlists to {filepath}")
         return filepath
@@ -574,9 +645,9 @@ class ElGooseScraper:
         """Convert song name to URL slug format"""
         # Basic slug conversion - lowercase, replace spaces/special chars with hyphens
         slug = song_name.lower()
-        slug = re.sub(r'[^a-z0-9\s\-&]', '', slug)  # Remove special chars except &
-        slug = re.sub(r'\s+', '-', slug)  # Replace spaces with hyphens
-        slug = re.sub(r'-+', '-', slug)  # Replace multiple hyphens with single
+        slug = SLUG_INVALID_CHARS_RE.sub('', slug)  # Remove special chars except &
+        slug = WHITESPACE_RE.sub('-', slug)  # Replace spaces with hyphens
+        slug = HYPHEN_RUN_RE.sub('-', slug)  # Replace multiple hyphens with single
         slug = slug.strip('-')  # Remove leading/trailing hyphens
         
         # Handle common cases
@@ -598,7 +669,7 @@ class ElGooseScraper:
             response = self.session.get(song_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             stats = self.parse_song_statistics_page(soup, song_name)
             
             # Cache the results
@@ -696,32 +767,32 @@ class ElGooseScraper:
             
             if description_text:
                 # Extract total times played
-                times_match = re.search(r'has been played by Goose (\d+) times', description_text)
+                times_match = TIMES_PLAYED_RE.search(description_text)
                 if times_match:
                     song_stats['total_times_played'] = int(times_match.group(1))
                 
                 # Extract show percentage
-                percentage_match = re.search(r'It was played at ([\d.]+)% of Goose shows', description_text)
+                percentage_match = SHOW_PERCENTAGE_RE.search(description_text)
                 if percentage_match:
                     song_stats['show_percentage'] = float(percentage_match.group(1))
                 
                 # Extract last played info
-                last_played_match = re.search(r'It was last played ([\d-]+)', description_text)
+                last_played_match = LAST_PLAYED_RE.search(description_text)
                 if last_played_match:
                     song_stats['last_played'] = last_played_match.group(1)
                 
                 # Extract shows since last played
-                shows_ago_match = re.search(r'which was (\d+) show\(s\) ago', description_text)
+                shows_ago_match = SHOWS_AGO_RE.search(description_text)
                 if shows_ago_match:
                     song_stats['shows_since_last_played'] = int(shows_ago_match.group(1))
                 
                 # Extract average frequency
-                frequency_match = re.search(r'once every (\d+) show\(s\)', description_text)
+                frequency_match = FREQUENCY_RE.search(description_text)
                 if frequency_match:
                     song_stats['average_frequency_shows'] = int(frequency_match.group(1))
                 
                 # Extract total shows since debut
-                total_shows_match = re.search(r'There have been (\d+) show\(s\) since the live debut', description_text)
+                total_shows_match = SHOWS_SINCE_DEBUT_RE.search(description_text)
                 if total_shows_match:
                     song_stats['total_shows_since_debut'] = int(total_shows_match.group(1))
                 
@@ -779,7 +850,7 @@ class ElGooseScraper:
             return None
         
         # Remove transition indicators like >, ->, <, etc.
-        cleaned = re.sub(r'^[>\-<\s]+|[>\-<\s]+$', '', song_text)
+        cleaned = TRANSITION_MARKS_RE.sub('', song_text)
         cleaned = cleaned.strip()
         
         return cleaned if cleaned else None
@@ -793,7 +864,7 @@ class ElGooseScraper:
             response = self.session.get(covers_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=TABLES_ONLY)
             covers_data = self.parse_song_database_page(soup, is_covers=True)
             
             # Cache the covers database
@@ -819,9 +890,9 @@ class ElGooseScraper:
             return None
         
         # Look for date pattern YYYY-MM-DD
-        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', debut_text)
+        date_match = DATE_RE.search(debut_text)
         if date_match:
-            return date_match.group(1)
+            return date_match.group(0)
         
         return None
     
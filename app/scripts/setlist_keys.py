@@ -0,0 +1,11 @@
+"""
+Primary-key helpers shared by the scraper and the sample-data script
+"""
+
+# Set label -> primary-key slug for the usual labels; anything else is slugged on the fly
+SET_SLUGS = {'Set 1': 'set1', 'Set 2': 'set2', 'Set 3': 'set3', 'Encore': 'encore', 'Encore 2': 'encore2'}
+
+
+def slug_for_set(set_name: str) -> str:
+    """Primary-key slug for a set label, e.g. 'Set 2' -> 'set2'"""
+    return SET_SLUGS.get(set_name) or set_name.lower().replace(' ', '')